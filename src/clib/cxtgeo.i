@@ -347,6 +347,38 @@ PyDict_SetItemString(d, "XTGeoCLibError", PY_XTGeoCLibError);
     }
 }
 
+/* Long running grid kernels that only work on C/numpy memory; release the GIL so
+   several grids can be processed from Python threads at the same time */
+%define %xtg_nogil(func)
+%exception func {
+    char *err;
+    clear_exception();
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+    if ((err = check_exception())) {
+        PyErr_SetString(PY_XTGeoCLibError, err);
+        return NULL;
+    }
+}
+%enddef
+
+%xtg_nogil(grd3cp3d_xtgformat1to2_geom);
+%xtg_nogil(grd3cp3d_xtgformat2to1_geom);
+%xtg_nogil(grd3d_adj_cells);
+%xtg_nogil(grd3d_collapse_inact);
+%xtg_nogil(grd3d_geometrics);
+%xtg_nogil(grd3d_get_all_corners);
+%xtg_nogil(grd3d_inact_outside_pol);
+%xtg_nogil(grdcp3d_calc_dx);
+%xtg_nogil(grdcp3d_calc_dy);
+%xtg_nogil(grdcp3d_calc_dz);
+%xtg_nogil(grdcp3d_calc_dxdydz);
+%xtg_nogil(grdcp3d_calc_xyz);
+%xtg_nogil(grdcp3d_cellvol);
+%xtg_nogil(grdcp3d_corners_batch);
+%xtg_nogil(grdcp3d_quality_indicators);
+
 %pythoncode %{
     XTGeoCLibError = _cxtgeo.XTGeoCLibError
 %}
@@ -8,10 +8,10 @@
  * DESCRIPTION:
  *
  * ARGUMENTS:
- *    efile            i     Filename to read from
- *    seqnum, day ...  o     vectors
- *    nmax             i     Max number of dates
- *    debug            i     debug level
+ *    fc               i     File handle to read from
+ *    tsteps           o     One vector of length 4 * nmax, holding the seqnum, day,
+ *                           month and year vectors after each other
+ *    ntsteps          i     Length of tsteps, nmax is the max number of dates
  * RETURNS:
  *    Function: nelements upon success, 0 or negative if problems
  *    Resulting vectors
@@ -45,8 +45,13 @@ _mystrsep(char **stringp, const char *delim)
 }
 
 int
-grd3d_ecl_tsteps(FILE *fc, int *seqnums, int *day, int *mon, int *year, int nmax)
+grd3d_ecl_tsteps(FILE *fc, int *tsteps, long ntsteps)
 {
+    int nmax = (int)(ntsteps / 4);
+    int *seqnums = tsteps;
+    int *day = tsteps + nmax;
+    int *mon = tsteps + 2 * nmax;
+    int *year = tsteps + 3 * nmax;
 
     char *keywords;
     int *rectypes;
@@ -123,8 +128,7 @@ grd3d_ecl_tsteps(FILE *fc, int *seqnums, int *day, int *mon, int *year, int nmax
             nc++;
 
             if (nc >= nmax) {
-                free(tofree);
-                free(keywords);
+                free(tofree); /* keywords points inside tofree here */
                 free(rectypes);
                 free(reclengths);
                 free(recstarts);
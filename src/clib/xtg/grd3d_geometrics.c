@@ -12,11 +12,13 @@
 *    coordsv           o     Coordinate vector (with numpy dimensions)
 *    zcornsv           o     ZCORN vector (with numpy dimensions)
 *    actnumsv          o     ACTNUM vector (with numpy dimensions)
-*    xori...zori       o     Return values for XYZ origin
-*    xmin, xmax, ...   o     Pointers to return values for X Y Z min and max
-*    rotation          o     rotation in degrees fro X axis anticlockwise,
+*    geometrics        o     Array of 13 return values, in this order:
+*                            xori, yori, zori: XYZ origin
+*                            xmin, xmax, ymin, ymax, zmin, zmax: X Y Z min and max
+*                            rotation: in degrees fro X axis anticlockwise,
 *                            normal math way
-*    dx...dz           o     Average increment
+*                            dx, dy, dz: Average increment
+*    ngeometrics       i     Length of geometrics array, must be 13
 *    option1           i     0: use all cells; 1, only cells with ACTNUM = 1,
 *                            2: all cells for XY, active only for Z cells
 *    option2           i     0: compute using cell corners, 1: use cell centers
@@ -55,19 +57,8 @@ grd3d_geometrics(int nx,
                  long nzcornin,
                  int *actnumsv,
                  long nactin,
-                 double *xori,
-                 double *yori,
-                 double *zori,
-                 double *xmin,
-                 double *xmax,
-                 double *ymin,
-                 double *ymax,
-                 double *zmin,
-                 double *zmax,
-                 double *rotation,
-                 double *dx,
-                 double *dy,
-                 double *dz,
+                 double *geometrics,
+                 long ngeometrics,
                  int option1,
                  int option2)
 
@@ -85,6 +76,11 @@ grd3d_geometrics(int nx,
     /* some working arrays */
     double *tmp_x, *tmp_y, *tmp_z;
 
+    if (ngeometrics != 13) {
+        throw_exception("Wrong length of geometrics array in grd3d_geometrics");
+        return -1;
+    }
+
     /* allocation of space depends on option2 */
 
     nxuse = nx;
@@ -375,25 +371,24 @@ grd3d_geometrics(int nx,
     if (fabs((vrmin - vrmax) / 0.5 * (vrmin + vrmax)) > 0.05)
         istat = 2;
 
-    *xmin = vxmin;
-    *xmax = vxmax;
-
-    *ymin = vymin;
-    *ymax = vymax;
-
-    *zmin = vzmin;
-    *zmax = vzmax;
-
     if (vrot < 0.0)
         vrot = vrot + 360;
-    *rotation = vrot;
-    *dx = vdx;
-    *dy = vdy;
-    *dz = vdz;
-
-    *xori = vxori;
-    *yori = vyori;
-    *zori = vzori;
+
+    geometrics[0] = vxori;
+    geometrics[1] = vyori;
+    geometrics[2] = vzori;
+
+    geometrics[3] = vxmin;
+    geometrics[4] = vxmax;
+    geometrics[5] = vymin;
+    geometrics[6] = vymax;
+    geometrics[7] = vzmin;
+    geometrics[8] = vzmax;
+
+    geometrics[9] = vrot;
+    geometrics[10] = vdx;
+    geometrics[11] = vdy;
+    geometrics[12] = vdz;
 
     free(tmp_x);
     free(tmp_y);
@@ -18,6 +18,7 @@
  *    p_zcornref_v   o     Z corners output (must be allocated before)
  *    p_actnumref_v  o     ACTNUM, new (must be allocated)
  *    rfac           i     Array for refinement factor per layer
+ *    nrfac          i     Length of rfac, shall be nz
  *
  * RETURNS:
  *    Function: 0: upon success
@@ -51,13 +52,19 @@ grd3d_refine_vert(int nx,
                   int *p_actnumref_v,
                   long numactref,
 
-                  int *rfac)
+                  int *rfac,
+                  long nrfac)
 
 {
     /* locals */
     int i, j, k, ic, kr, kk, rfactor, iact;
     double rdz, ztop, zbot;
 
+    if (nrfac != nz) {
+        throw_exception("Wrong length of rfac in grd3d_refine_vert");
+        return EXIT_FAILURE;
+    }
+
     grd3d_make_z_consistent(nx, ny, nz, zcornsv, 0, 0.0);
 
     for (j = 1; j <= ny; j++) {
@@ -167,6 +167,264 @@ z_projection(const double x1,
     return z2 - z1;
 }
 
+/**
+ * Adds the contributions of the y direction edges between corner line p - 1
+ * and p to dy. Requires p % (ny + 1) != 0.
+ */
+static int
+_dy_pair(const double *coordsv,
+         const double *zcornsv,
+         const int ny,
+         const int nz,
+         const size_t p,
+         const size_t num_plane,
+         metric m,
+         double *dy)
+{
+    PlanarMap pm1, pm2;
+    if (pm_from_corner_line(coordsv, p - 1, &pm1) == EXIT_FAILURE) {
+        return EXIT_FAILURE;
+    }
+    if (pm_from_corner_line(coordsv, p, &pm2) == EXIT_FAILURE) {
+        return EXIT_FAILURE;
+    }
+
+    // Corresponding to the corner lines in the pair, there are two pillars
+    // of cells. Those having the edges of that pair to the west and those
+    // having them to the east (west/east is x direction). We go through
+    // each layer in that pillar/line pair.
+    size_t west_pillar_start = nz * ((p / (ny + 1)) * ny + p % (ny + 1) - 1);
+    size_t corner_line1_start = (nz + 1) * (p - 1);
+    size_t corner_line1_end = corner_line1_start + (nz + 1);
+    size_t corner_line2_start = (nz + 1) * p;
+
+    char west_in_bounds = p >= ny + 1;
+    char east_in_bounds = p < num_plane - (ny + 1);
+
+    for (size_t j = corner_line1_start, k = corner_line2_start, jj = west_pillar_start;
+         j < corner_line1_end; j += 1, k += 1, jj += 1) {
+        // In each layer there is the east and west (x direction)
+        // z values (west is l=0, east is l=1)
+        for (size_t l = 0; l < 2; l += 1) {
+
+            // calculate the x and y values for
+            // this layer and east/west in both
+            // corner lines of the pair.
+            double z1 = zcornsv[4 * j + l + 2];
+            double x1, y1;
+            if (pm_evaluate(&pm1, z1, &x1, &y1) == EXIT_FAILURE) {
+                return EXIT_FAILURE;
+            }
+
+            double z2 = zcornsv[4 * k + l];
+            double x2, y2;
+            if (pm_evaluate(&pm2, z2, &x2, &y2) == EXIT_FAILURE) {
+                return EXIT_FAILURE;
+            }
+
+            // The corresponding line contributes 1/4 of its length to the
+            // dx value of up to two surrounding cells it is an edge of
+            double vector_len = 0.25 * m(x1, y1, z1, x2, y2, z2);
+
+            char at_top = j == (corner_line1_end - 1);
+            char at_bottom = j == corner_line1_start;
+
+            if (l == 0 && west_in_bounds) {
+                // the cell to the west and above the edge
+                if (!at_top) {
+                    dy[jj - (ny * nz)] += vector_len;
+                }
+
+                // the cell to the west and below the edge
+                if (!at_bottom) {
+                    dy[(jj - (ny * nz)) - 1] += vector_len;
+                }
+            } else if (l == 1 && east_in_bounds) {
+                // the cell to the east and above the edge
+                if (!at_top) {
+                    dy[jj] += vector_len;
+                }
+
+                // index of the cell to the easts and below the edge
+                if (!at_bottom) {
+                    dy[jj - 1] += vector_len;
+                }
+            }
+        }
+    }
+    return EXIT_SUCCESS;
+}
+
+/**
+ * Adds the contributions of the x direction edges between corner line p
+ * and p + ny + 1 to dx.
+ */
+static int
+_dx_pair(const double *coordsv,
+         const double *zcornsv,
+         const int ny,
+         const int nz,
+         const size_t p,
+         metric m,
+         double *dx)
+{
+    // The first corner line in the pair
+    PlanarMap pm1;
+    if (pm_from_corner_line(coordsv, p, &pm1) == EXIT_FAILURE) {
+        return EXIT_FAILURE;
+    }
+
+    // The next corner line in x direction (second in the pair)
+    PlanarMap pm2;
+    if (pm_from_corner_line(coordsv, p + ny + 1, &pm2) == EXIT_FAILURE) {
+        return EXIT_FAILURE;
+    }
+
+    // Corresponding to the corner lines in the pair, there are two pillars
+    // of cells. Those having the edges of that pair to the north and those
+    // having them to the south (north/south is y direction). We go through
+    // each layer in that pillar/line pair.
+    size_t north_pillar_start = nz * ((p / (ny + 1)) * ny + p % (ny + 1));
+    size_t corner_line1_start = (nz + 1) * p;
+    size_t corner_line1_end = corner_line1_start + (nz + 1);
+    size_t corner_line2_start = (nz + 1) * (p + (ny + 1));
+
+    char north_in_bounds = p % (ny + 1) != ny;
+    char south_in_bounds = p % (ny + 1) != 0;
+
+    for (size_t j = corner_line1_start, k = corner_line2_start, jj = north_pillar_start;
+         j < corner_line1_end; j += 1, k += 1, jj += 1) {
+        // In each layer there is the north and south (y direction)
+        // z values (south is l=0, north is l=2)
+        for (size_t l = 0; l < 4; l += 2) {
+
+            // calculate the x and y values for
+            // this layer and north/south in both
+            // corner lines of the pair.
+            double z1 = zcornsv[4 * j + l + 1];
+            double x1, y1;
+            if (pm_evaluate(&pm1, z1, &x1, &y1) == EXIT_FAILURE) {
+                return EXIT_FAILURE;
+            }
+
+            double z2 = zcornsv[4 * k + l];
+            double x2, y2;
+            if (pm_evaluate(&pm2, z2, &x2, &y2) == EXIT_FAILURE) {
+                return EXIT_FAILURE;
+            }
+
+            // The corresponding line contributes 1/4 of its length to the
+            // dx value of up to two surrounding cells it is an edge of
+            double vector_len = 0.25 * m(x1, y1, z1, x2, y2, z2);
+
+            char at_top = j == (corner_line1_end - 1);
+            char at_bottom = j == corner_line1_start;
+
+            if (l == 0 && south_in_bounds) {
+                // the cell to the south and above the edge
+                if (!at_top) {
+                    dx[jj - nz] += vector_len;
+                }
+
+                // the cell to the south and below the edge
+                if (!at_bottom) {
+                    dx[(jj - nz) - 1] += vector_len;
+                }
+            } else if (l == 2 && north_in_bounds) {
+                // the cell to the south and above the edge
+                if (!at_top) {
+                    dx[jj] += vector_len;
+                }
+
+                // index of the cell to the south and below the edge
+                if (!at_bottom) {
+                    dx[jj - 1] += vector_len;
+                }
+            }
+        }
+    }
+    return EXIT_SUCCESS;
+}
+
+/**
+ * Adds the contributions of the z direction edges along corner line p to dz.
+ */
+static int
+_dz_line(const double *coordsv,
+         const double *zcornsv,
+         const int ny,
+         const int nz,
+         const size_t p,
+         const size_t num_corner_lines,
+         metric m,
+         double *dz)
+{
+    PlanarMap pm;
+    if (pm_from_corner_line(coordsv, p, &pm) == EXIT_FAILURE) {
+        return EXIT_FAILURE;
+    }
+
+    size_t north_east_pillar_start = nz * ((p / (ny + 1)) * ny + p % (ny + 1));
+    size_t corner_line_start = (nz + 1) * p;
+    size_t corner_line_end = corner_line_start + (nz + 1);
+
+    char north_in_bounds = p % (ny + 1) != ny;
+    char south_in_bounds = p % (ny + 1) != 0;
+    char west_in_bounds = p >= ny + 1;
+    char east_in_bounds = p < num_corner_lines - (ny + 1);
+
+    for (size_t j = corner_line_start, jj = north_east_pillar_start;
+         j < corner_line_end - 1; j += 1, jj += 1) {
+        for (size_t l = 0; l < 4; l++) {
+
+            double z1 = zcornsv[4 * j + l];
+            double x1, y1;
+            if (pm_evaluate(&pm, z1, &x1, &y1) == EXIT_FAILURE) {
+                return EXIT_FAILURE;
+            }
+
+            double z2 = zcornsv[4 * (j + 1) + l];
+            double x2, y2;
+            if (pm_evaluate(&pm, z2, &x2, &y2) == EXIT_FAILURE) {
+                return EXIT_FAILURE;
+            }
+
+            // The corresponding line contributes 1/4 of its length to the
+            // dx value of one edge depending on l.
+            double vector_len = 0.25 * m(x1, y1, z1, x2, y2, z2);
+
+            if (l == 0 && south_in_bounds && west_in_bounds) {
+                dz[jj - nz * (ny + 1)] += vector_len;
+            } else if (l == 1 && south_in_bounds && east_in_bounds) {
+                dz[jj - nz] += vector_len;
+            } else if (l == 2 && north_in_bounds && west_in_bounds) {
+                dz[jj - nz * ny] += vector_len;
+            } else if (l == 3 && north_in_bounds && east_in_bounds) {
+                dz[jj] += vector_len;
+            }
+        }
+    }
+    return EXIT_SUCCESS;
+}
+
+static int
+_check_sizes(int nx, int ny, int nz, long ncoord, long nzcorn, long ncell)
+{
+    if (ncoord != (nx + 1) * (ny + 1) * 6) {
+        throw_exception("Incorrect size of coordsv.");
+        return EXIT_FAILURE;
+    }
+    if (nzcorn != (nx + 1) * (ny + 1) * (nz + 1) * 4) {
+        throw_exception("Incorrect size of zcornsv.");
+        return EXIT_FAILURE;
+    }
+    if (ncell != nx * ny * nz) {
+        throw_exception("Incorrect size of dx.");
+        return EXIT_FAILURE;
+    }
+    return EXIT_SUCCESS;
+}
+
 int
 grdcp3d_calc_dy(int nx,
                 int ny,
@@ -180,16 +438,7 @@ grdcp3d_calc_dy(int nx,
                 metric m)
 
 {
-    if (ncoord != (nx + 1) * (ny + 1) * 6) {
-        throw_exception("Incorrect size of coordsv.");
-        return EXIT_FAILURE;
-    }
-    if (nzcorn != (nx + 1) * (ny + 1) * (nz + 1) * 4) {
-        throw_exception("Incorrect size of zcornsv.");
-        return EXIT_FAILURE;
-    }
-    if (ndy != nx * ny * nz) {
-        throw_exception("Incorrect size of dx.");
+    if (_check_sizes(nx, ny, nz, ncoord, nzcorn, ndy) == EXIT_FAILURE) {
         return EXIT_FAILURE;
     }
     if (ndy <= 0) {
@@ -199,99 +448,15 @@ grdcp3d_calc_dy(int nx,
     // The following algorithm goes through all subsequent pairs of corner
     // lines in y direction, calculates the length of the lines between the
     // their corners and adds it contribution to the average of the cells
-    // it is an edge of.
-
-    // The initial first corner line in the pair
-    PlanarMap pm1;
-    if (pm_from_corner_line(coordsv, 0, &pm1) == EXIT_FAILURE) {
-        return EXIT_FAILURE;
-    }
-    size_t corner_line1_start = 0;
+    // it is an edge of. The pair of corners going from the end of a row
+    // to the start of the next row is skipped.
 
     size_t num_plane = (nx + 1) * (ny + 1);
-    for (size_t pair_index = 1, cell_plane_index = 0; pair_index < num_plane;
-         pair_index++) {
-
-        // The next corner line in y direction (second in the pair)
-        PlanarMap pm2;
-        if (pm_from_corner_line(coordsv, pair_index, &pm2) == EXIT_FAILURE) {
+    for (size_t p = 1; p < num_plane; p++) {
+        if (p % (ny + 1) != 0 &&
+            _dy_pair(coordsv, zcornsv, ny, nz, p, num_plane, m, dy) == EXIT_FAILURE) {
             return EXIT_FAILURE;
         }
-
-        // Corresponding to the corner lines in the pair, there are two pillars
-        // of cells. Those having the edges of that pair to the west and those
-        // having them to the east (west/east is x direction). We go through
-        // each layer in that pillar/line pair.
-        size_t west_pillar_start = nz * cell_plane_index;
-        size_t corner_line1_end = corner_line1_start + (nz + 1);
-        size_t corner_line2_start = (nz + 1) * pair_index;
-
-        // Skip the pair of corners going from the end of a row
-        // to the start of the next row
-        if (pair_index % (ny + 1) != 0) {
-
-            char west_in_bounds = pair_index >= ny + 1;
-            char east_in_bounds = pair_index < num_plane - (ny + 1);
-
-            for (size_t j = corner_line1_start, k = corner_line2_start,
-                        jj = west_pillar_start;
-                 j < corner_line1_end; j += 1, k += 1, jj += 1) {
-                // In each layer there is the east and west (x direction)
-                // z values (west is l=0, east is l=1)
-                for (size_t l = 0; l < 2; l += 1) {
-
-                    // calculate the x and y values for
-                    // this layer and east/west in both
-                    // corner lines of the pair.
-                    double z1 = zcornsv[4 * j + l + 2];
-                    double x1, y1;
-                    if (pm_evaluate(&pm1, z1, &x1, &y1) == EXIT_FAILURE) {
-                        return EXIT_FAILURE;
-                    }
-
-                    double z2 = zcornsv[4 * k + l];
-                    double x2, y2;
-                    if (pm_evaluate(&pm2, z2, &x2, &y2) == EXIT_FAILURE) {
-                        return EXIT_FAILURE;
-                    }
-
-                    // The corresponding line contributes 1/4 of its length to the
-                    // dx value of up to two surrounding cells it is an edge of
-                    double vector_len = 0.25 * m(x1, y1, z1, x2, y2, z2);
-
-                    char at_top = j == (corner_line1_end - 1);
-                    char at_bottom = j == corner_line1_start;
-
-                    if (l == 0 && west_in_bounds) {
-                        // the cell to the west and above the edge
-                        if (!at_top) {
-                            dy[jj - (ny * nz)] += vector_len;
-                        }
-
-                        // the cell to the west and below the edge
-                        if (!at_bottom) {
-                            dy[(jj - (ny * nz)) - 1] += vector_len;
-                        }
-                    } else if (l == 1 && east_in_bounds) {
-                        // the cell to the east and above the edge
-                        if (!at_top) {
-                            dy[jj] += vector_len;
-                        }
-
-                        // index of the cell to the easts and below the edge
-                        if (!at_bottom) {
-                            dy[jj - 1] += vector_len;
-                        }
-                    }
-                }
-            }
-            // Since there are one more corner line in the y direction then there
-            // are cells we have to keep a separate index for cells
-            cell_plane_index++;
-        }
-        // update the first corner line map and start
-        pm1 = pm2;
-        corner_line1_start = corner_line2_start;
     }
     return EXIT_SUCCESS;
 }
@@ -309,16 +474,7 @@ grdcp3d_calc_dx(int nx,
                 metric m)
 
 {
-    if (ncoord != (nx + 1) * (ny + 1) * 6) {
-        throw_exception("Incorrect size of coordsv.");
-        return EXIT_FAILURE;
-    }
-    if (nzcorn != (nx + 1) * (ny + 1) * (nz + 1) * 4) {
-        throw_exception("Incorrect size of zcornsv.");
-        return EXIT_FAILURE;
-    }
-    if (ndx != nx * ny * nz) {
-        throw_exception("Incorrect size of dx.");
+    if (_check_sizes(nx, ny, nz, ncoord, nzcorn, ndx) == EXIT_FAILURE) {
         return EXIT_FAILURE;
     }
     if (ndx <= 0) {
@@ -331,91 +487,10 @@ grdcp3d_calc_dx(int nx,
     // it is an edge of.
 
     size_t num_line_pairs = nx * (ny + 1);
-
-    for (size_t pair_index = 0, cell_plane_index = 0; pair_index < num_line_pairs;
-         pair_index++) {
-        if (pair_index % (ny + 1) != 0) {
-            // There is one more line in the y direction then there
-            // are cells, so we have to keep two indices.
-            cell_plane_index++;
-        }
-
-        // The first corner line in the pair
-        PlanarMap pm1;
-        if (pm_from_corner_line(coordsv, pair_index, &pm1) == EXIT_FAILURE) {
-            return EXIT_FAILURE;
-        }
-
-        // The next corner line in x direction (second in the pair)
-        PlanarMap pm2;
-        if (pm_from_corner_line(coordsv, pair_index + ny + 1, &pm2) == EXIT_FAILURE) {
+    for (size_t p = 0; p < num_line_pairs; p++) {
+        if (_dx_pair(coordsv, zcornsv, ny, nz, p, m, dx) == EXIT_FAILURE) {
             return EXIT_FAILURE;
         }
-
-        // Corresponding to the corner lines in the pair, there are two pillars
-        // of cells. Those having the edges of that pair to the north and those
-        // having them to the south (north/south is y direction). We go through
-        // each layer in that pillar/line pair.
-        size_t north_pillar_start = nz * cell_plane_index;
-        size_t corner_line1_start = (nz + 1) * pair_index;
-        size_t corner_line1_end = corner_line1_start + (nz + 1);
-        size_t corner_line2_start = (nz + 1) * (pair_index + (ny + 1));
-
-        char north_in_bounds = pair_index % (ny + 1) != ny;
-        char south_in_bounds = pair_index % (ny + 1) != 0;
-
-        for (size_t j = corner_line1_start, k = corner_line2_start,
-                    jj = north_pillar_start;
-             j < corner_line1_end; j += 1, k += 1, jj += 1) {
-            // In each layer there is the north and south (y direction)
-            // z values (south is l=0, north is l=2)
-            for (size_t l = 0; l < 4; l += 2) {
-
-                // calculate the x and y values for
-                // this layer and north/south in both
-                // corner lines of the pair.
-                double z1 = zcornsv[4 * j + l + 1];
-                double x1, y1;
-                if (pm_evaluate(&pm1, z1, &x1, &y1) == EXIT_FAILURE) {
-                    return EXIT_FAILURE;
-                }
-
-                double z2 = zcornsv[4 * k + l];
-                double x2, y2;
-                if (pm_evaluate(&pm2, z2, &x2, &y2) == EXIT_FAILURE) {
-                    return EXIT_FAILURE;
-                }
-
-                // The corresponding line contributes 1/4 of its length to the
-                // dx value of up to two surrounding cells it is an edge of
-                double vector_len = 0.25 * m(x1, y1, z1, x2, y2, z2);
-
-                char at_top = j == (corner_line1_end - 1);
-                char at_bottom = j == corner_line1_start;
-
-                if (l == 0 && south_in_bounds) {
-                    // the cell to the south and above the edge
-                    if (!at_top) {
-                        dx[jj - nz] += vector_len;
-                    }
-
-                    // the cell to the south and below the edge
-                    if (!at_bottom) {
-                        dx[(jj - nz) - 1] += vector_len;
-                    }
-                } else if (l == 2 && north_in_bounds) {
-                    // the cell to the south and above the edge
-                    if (!at_top) {
-                        dx[jj] += vector_len;
-                    }
-
-                    // index of the cell to the south and below the edge
-                    if (!at_bottom) {
-                        dx[jj - 1] += vector_len;
-                    }
-                }
-            }
-        }
     }
     return EXIT_SUCCESS;
 }
@@ -433,16 +508,7 @@ grdcp3d_calc_dz(int nx,
                 metric m)
 
 {
-    if (ncoord != (nx + 1) * (ny + 1) * 6) {
-        throw_exception("Incorrect size of coordsv.");
-        return EXIT_FAILURE;
-    }
-    if (nzcorn != (nx + 1) * (ny + 1) * (nz + 1) * 4) {
-        throw_exception("Incorrect size of zcornsv.");
-        return EXIT_FAILURE;
-    }
-    if (ndx != nx * ny * nz) {
-        throw_exception("Incorrect size of dx.");
+    if (_check_sizes(nx, ny, nz, ncoord, nzcorn, ndx) == EXIT_FAILURE) {
         return EXIT_FAILURE;
     }
     if (ndx <= 0) {
@@ -455,59 +521,64 @@ grdcp3d_calc_dz(int nx,
     // corresponding cells.
 
     size_t num_corner_lines = (nx + 1) * (ny + 1);
-
-    for (size_t pair_index = 0, cell_plane_index = 0; pair_index < num_corner_lines;
-         pair_index++) {
-        if (pair_index % (ny + 1) != 0) {
-            // There is one more line in the y direction then there
-            // are cells, so we have to keep two indecies.
-            cell_plane_index++;
-        }
-
-        PlanarMap pm;
-        if (pm_from_corner_line(coordsv, pair_index, &pm) == EXIT_FAILURE) {
+    for (size_t p = 0; p < num_corner_lines; p++) {
+        if (_dz_line(coordsv, zcornsv, ny, nz, p, num_corner_lines, m, dx) ==
+            EXIT_FAILURE) {
             return EXIT_FAILURE;
         }
+    }
+    return EXIT_SUCCESS;
+}
 
-        size_t north_east_pillar_start = nz * cell_plane_index;
-        size_t corner_line_start = (nz + 1) * pair_index;
-        size_t corner_line_end = corner_line_start + (nz + 1);
-
-        char north_in_bounds = pair_index % (ny + 1) != ny;
-        char south_in_bounds = pair_index % (ny + 1) != 0;
-        char west_in_bounds = pair_index >= ny + 1;
-        char east_in_bounds = pair_index < num_corner_lines - (ny + 1);
-
-        for (size_t j = corner_line_start, jj = north_east_pillar_start;
-             j < corner_line_end - 1; j += 1, jj += 1) {
-            for (size_t l = 0; l < 4; l++) {
-
-                double z1 = zcornsv[4 * j + l];
-                double x1, y1;
-                if (pm_evaluate(&pm, z1, &x1, &y1) == EXIT_FAILURE) {
-                    return EXIT_FAILURE;
-                }
-
-                double z2 = zcornsv[4 * (j + 1) + l];
-                double x2, y2;
-                if (pm_evaluate(&pm, z2, &x2, &y2) == EXIT_FAILURE) {
-                    return EXIT_FAILURE;
-                }
+/**
+ * As grdcp3d_calc_dx, grdcp3d_calc_dy and grdcp3d_calc_dz in one pass over
+ * the corner lines, so zcornsv is only streamed once. When reaching corner
+ * line p, the dz edges along p, the dy edges between p - 1 and p and the
+ * dx edges between p - (ny + 1) and p are added, which gives the same
+ * summation order per cell as the separate functions.
+ */
+int
+grdcp3d_calc_dxdydz(int nx,
+                    int ny,
+                    int nz,
+                    double *coordsv,
+                    long ncoord,
+                    double *zcornsv,
+                    long nzcorn,
+                    double *dx,
+                    long ndx,
+                    double *dy,
+                    long ndy,
+                    double *dz,
+                    long ndz,
+                    metric mx,
+                    metric my,
+                    metric mz)
 
-                // The corresponding line contributes 1/4 of its length to the
-                // dx value of one edge depending on l.
-                double vector_len = 0.25 * m(x1, y1, z1, x2, y2, z2);
+{
+    if (_check_sizes(nx, ny, nz, ncoord, nzcorn, ndx) == EXIT_FAILURE ||
+        _check_sizes(nx, ny, nz, ncoord, nzcorn, ndy) == EXIT_FAILURE ||
+        _check_sizes(nx, ny, nz, ncoord, nzcorn, ndz) == EXIT_FAILURE) {
+        return EXIT_FAILURE;
+    }
+    if (ndx <= 0) {
+        return EXIT_SUCCESS;
+    }
 
-                if (l == 0 && south_in_bounds && west_in_bounds) {
-                    dx[jj - nz * (ny + 1)] += vector_len;
-                } else if (l == 1 && south_in_bounds && east_in_bounds) {
-                    dx[jj - nz] += vector_len;
-                } else if (l == 2 && north_in_bounds && west_in_bounds) {
-                    dx[jj - nz * ny] += vector_len;
-                } else if (l == 3 && north_in_bounds && east_in_bounds) {
-                    dx[jj] += vector_len;
-                }
-            }
+    size_t num_corner_lines = (nx + 1) * (ny + 1);
+    for (size_t p = 0; p < num_corner_lines; p++) {
+        if (_dz_line(coordsv, zcornsv, ny, nz, p, num_corner_lines, mz, dz) ==
+            EXIT_FAILURE) {
+            return EXIT_FAILURE;
+        }
+        if (p % (ny + 1) != 0 &&
+            _dy_pair(coordsv, zcornsv, ny, nz, p, num_corner_lines, my, dy) ==
+              EXIT_FAILURE) {
+            return EXIT_FAILURE;
+        }
+        if (p >= (size_t)(ny + 1) &&
+            _dx_pair(coordsv, zcornsv, ny, nz, p - (ny + 1), mx, dx) == EXIT_FAILURE) {
+            return EXIT_FAILURE;
         }
     }
     return EXIT_SUCCESS;
@@ -53,17 +53,12 @@ grdcp3d_calc_xyz(long ncol,
         return;
     }
 
-    double xv, yv, zv;
+    /* cells are independent, so the columns can be shared between threads */
+#pragma omp parallel for
     for (long i = 0; i < ncol; i++) {
         for (long j = 0; j < nrow; j++) {
             for (long k = 0; k < nlay; k++) {
-                /* Offset (i,j,k) by 1 because starting from 0. */
-                long ic = x_ijk2ic(i + 1, j + 1, k + 1, ncol, nrow, nlay, 0);
-                if (ic < 0) {
-                    throw_exception("Loop through grid resulted in index outside "
-                                    "boundary in grdcp3d_calc_xyz");
-                    return;
-                }
+                long ic = i * nrow * nlay + j * nlay + k;
 
                 /* If we want to mask inactive cells */
                 if (option == 1 && actnumsv[ic] == 0) {
@@ -73,6 +68,7 @@ grdcp3d_calc_xyz(long ncol,
                     continue;
                 }
 
+                double xv, yv, zv;
                 grdcp3d_midpoint(i, j, k, ncol, nrow, nlay, coordsv, ncoord, zcornsv,
                         nzcorn, &xv, &yv, &zv);
 
@@ -49,12 +49,11 @@ grdcp3d_cellvol(long ncol,
 {
 
     logger_info(LI, FI, FU, "Cell bulk volume...");
-    double *corners = calloc(24, sizeof(double));
-
-    long i, j, k;
-    for (i = 0; i < ncol; i++) {
-        for (j = 0; j < nrow; j++) {
-            for (k = 0; k < nlay; k++) {
+    /* cells are independent, so the columns can be shared between threads */
+#pragma omp parallel for
+    for (long i = 0; i < ncol; i++) {
+        for (long j = 0; j < nrow; j++) {
+            for (long k = 0; k < nlay; k++) {
 
                 long ic = i * nrow * nlay + j * nlay + k;
 
@@ -63,6 +62,7 @@ grdcp3d_cellvol(long ncol,
                     continue;
                 }
 
+                double corners[24];
                 grdcp3d_corners(i, j, k, ncol, nrow, nlay, coordsv, ncoord, zcornsv,
                                 nzcorn, corners);
 
@@ -71,6 +71,5 @@ grdcp3d_cellvol(long ncol,
         }
     }
 
-    free(corners);
     logger_info(LI, FI, FU, "Cell bulk volume... done");
 }
\ No newline at end of file
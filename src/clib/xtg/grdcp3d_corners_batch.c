@@ -0,0 +1,59 @@
+/*
+ ***************************************************************************************
+ *
+ * NAME:
+ *    grdcp3d_corners_batch.c
+ *
+ * DESCRIPTION:
+ *    As grdcp3d_corners, but for many cells in one call. For xtgformat=2 layout
+ *
+ * ARGUMENTS:
+ *    ncol,nrow,nlay   i     Grid dimensions nx ny nz
+ *    coordsv          i     Grid Z coord for input
+ *    zcornsv          i     Grid Z corners for input
+ *    ijk              i     Cell indices i0, j0, k0, i1, j1, k1, ..., base 0
+ *    nijk             i     Length of ijk, 3 per cell
+ *    corners          o     Array, 24 values per cell allocated at client
+ *    ncorners         i     Length of corners, 24 per cell
+ *
+ * RETURNS:
+ *    corners, _xtgformat=2, in the same order as grdcp3d_corners per cell
+ *
+ * TODO/ISSUES/BUGS:
+ *    Indices are assumed to be within the grid, this is checked at client.
+ *
+ * LICENCE:
+ *    cf. XTGeo License
+ ***************************************************************************************
+ */
+
+#include "libxtg.h"
+#include "libxtg_.h"
+#include "logger.h"
+
+void
+grdcp3d_corners_batch(long ncol,
+                      long nrow,
+                      long nlay,
+                      double *coordsv,
+                      long ncoordin,
+                      float *zcornsv,
+                      long nzcornin,
+                      int *ijk,
+                      long nijk,
+                      double *corners,
+                      long ncorners)
+
+{
+    long m, ncell = nijk / 3;
+
+    if (nijk % 3 != 0 || ncorners != 24 * ncell) {
+        throw_exception("Wrong length of ijk or corners in grdcp3d_corners_batch");
+        return;
+    }
+
+    for (m = 0; m < ncell; m++) {
+        grdcp3d_corners(ijk[3 * m], ijk[3 * m + 1], ijk[3 * m + 2], ncol, nrow, nlay,
+                        coordsv, ncoordin, zcornsv, nzcornin, &corners[24 * m]);
+    }
+}
@@ -1154,6 +1154,24 @@ grdcp3d_calc_dz(int nx,
                 long n_swig_np_dbl_inplace_v1,   // ntot,
                 metric m);
 
+int
+grdcp3d_calc_dxdydz(int nx,
+                    int ny,
+                    int nz,
+                    double *swig_np_dbl_in_v1,       // *coordsv,
+                    long n_swig_np_dbl_in_v1,        // ncoord,
+                    double *swig_np_dbl_in_v2,       // *zcornsv,
+                    long n_swig_np_dbl_in_v2,        // nzcorn,
+                    double *swig_np_dbl_inplace_v1,  // *dx,
+                    long n_swig_np_dbl_inplace_v1,   // ntot,
+                    double *swig_np_dbl_inplace_v2,  // *dy,
+                    long n_swig_np_dbl_inplace_v2,   // ntot,
+                    double *swig_np_dbl_inplace_v3,  // *dz,
+                    long n_swig_np_dbl_inplace_v3,   // ntot,
+                    metric mx,
+                    metric my,
+                    metric mz);
+
 void
 grdcp3d_calc_xyz(long ncol,
                  long nrow,
@@ -1229,7 +1247,9 @@ grd3d_roff2xtgeo_splitenz(int nz,
 );
 
 int
-grd3d_ecl_tsteps(FILE *fc, int *seqnums, int *day, int *mon, int *year, int nmax);
+grd3d_ecl_tsteps(FILE *fc,
+                 int *swig_np_int_inplaceflat_v1,  // *tsteps, seqnum day mon year
+                 long n_swig_np_int_inplaceflat_v1);
 
 int
 grd3d_conv_grid_roxapi(int ncol,
@@ -1333,7 +1353,9 @@ grd3d_refine_vert(int nx,
                   int *swig_np_int_inplace_v1,     // *p_actnumref_v
                   long n_swig_np_int_inplace_v1,   // nactref
 
-                  int *rfac);
+                  int *swig_np_int_in_v2,   // *rfac
+                  long n_swig_np_int_in_v2  // nrfac
+);
 
 void
 grd3d_convert_hybrid(int nx,
@@ -1612,19 +1634,8 @@ grd3d_geometrics(int nx,
                  int *swig_np_int_in_v1,     // *actnumsv
                  long n_swig_np_int_in_v1,   // nact
 
-                 double *xori,
-                 double *yori,
-                 double *zori,
-                 double *xmin,
-                 double *xmax,
-                 double *ymin,
-                 double *ymax,
-                 double *zmin,
-                 double *zmax,
-                 double *rotation,
-                 double *dx,
-                 double *dy,
-                 double *dz,
+                 double *swig_np_dbl_aout_v1,  // *geometrics
+                 long n_swig_np_dbl_aout_v1,   // ngeometrics
                  int option1,
                  int option2);
 
@@ -1647,12 +1658,12 @@ grd3d_adj_cells(int ncol,
                 long n_swig_np_dbl_in_v2,       // nzcornin
                 int *swig_np_int_inplace_v1,    // *actnumsv
                 long n_swig_np_int_inplace_v1,  // nact
-                int *p_prop1,
-                long nprop1,
+                int *swig_np_int_in_v2,              // *p_prop1
+                long n_swig_np_int_in_v2,            // nprop1
                 int val1,
                 int val2,
-                int *p_prop2,
-                long nprop2,
+                int *swig_np_int_inplaceflat_v1,     // *p_prop2
+                long n_swig_np_int_inplaceflat_v1,   // nprop2
                 int iflag1,
                 int iflag2);
 
@@ -1686,30 +1697,8 @@ grd3d_get_all_corners(int nx,
                       int *swig_np_int_in_v1,     // *actnumsv
                       long n_swig_np_int_in_v1,   // nactin
 
-                      double *x1,
-                      double *y1,
-                      double *z1,
-                      double *x2,
-                      double *y2,
-                      double *z2,
-                      double *x3,
-                      double *y3,
-                      double *z3,
-                      double *x4,
-                      double *y4,
-                      double *z4,
-                      double *x5,
-                      double *y5,
-                      double *z5,
-                      double *x6,
-                      double *y6,
-                      double *z6,
-                      double *x7,
-                      double *y7,
-                      double *z7,
-                      double *x8,
-                      double *y8,
-                      double *z8,
+                      double *swig_np_dbl_inplace_v1,  // *corners
+                      long n_swig_np_dbl_inplace_v1,   // ncorners
                       int option);
 
 int
@@ -1819,6 +1808,19 @@ grdcp3d_corners(long ic,
                 long n_swig_np_flt_inplaceflat_v1,
                 double corners[]);
 
+void
+grdcp3d_corners_batch(long ncol,
+                      long nrow,
+                      long nlay,
+                      double *swig_np_dbl_inplaceflat_v1,  // coordsv
+                      long n_swig_np_dbl_inplaceflat_v1,
+                      float *swig_np_flt_inplaceflat_v1,  // zcornsv
+                      long n_swig_np_flt_inplaceflat_v1,
+                      int *swig_np_int_in_v1,  // ijk
+                      long n_swig_np_int_in_v1,
+                      double *swig_np_dbl_inplace_v1,  // corners
+                      long n_swig_np_dbl_inplace_v1);
+
 long
 grdcp3d_get_vtk_esg_geometry_data(
   long ncol,
@@ -14,7 +14,7 @@ from collections.abc import Callable
 from os.path import join
 from tempfile import mkstemp
 from types import BuiltinFunctionType
-from typing import TYPE_CHECKING, Literal, Union
+from typing import TYPE_CHECKING, Any, Literal, Union
 
 import h5py
 import numpy as np
@@ -86,9 +86,34 @@ SUPPORTED_FORMATS = {
     "rms_attr": ["rms_attr", "rms_attrs", "rmsattr.*"],
 }
 
+# SUPPORTED_FORMATS as lookup tables; exact variants first (reversed so the
+# first format listing a variant wins), then variants that are regexps
+_FORMAT_BY_VARIANT = {
+    var: fmt
+    for fmt, variants in reversed(SUPPORTED_FORMATS.items())
+    for var in variants
+}
+_FORMAT_BY_PATTERN = [
+    (re.compile(var), fmt)
+    for fmt, variants in SUPPORTED_FORMATS.items()
+    for var in variants
+    if "*" in var
+]
+
 VALID_FILE_ALIASES = ["$fmu-v1", "$md5sum", "$random"]
 
 
+def _format_by_variant(variant: str) -> str | None:
+    """Return the generic format for a file suffix or format name, if any."""
+    fmt = _FORMAT_BY_VARIANT.get(variant)
+    if fmt is not None:
+        return fmt
+    for pattern, fmt in _FORMAT_BY_PATTERN:
+        if pattern.match(variant):
+            return fmt
+    return None
+
+
 def npfromfile(
     fname: str | pathlib.Path | io.BytesIO | io.StringIO,
     dtype: npt.DTypeLike = np.float32,
@@ -127,8 +152,23 @@ def check_folder(
     return status
 
 
+def _new_hash(hashmethod: Literal["md5", "sha256", "blake2b"] | Callable) -> Any:
+    """Return a new hash object for the given hashmethod, see generic_hash()."""
+    validmethods: dict[str, Callable] = {
+        "md5": hashlib.md5,
+        "sha256": hashlib.sha256,
+        "blake2b": hashlib.blake2b,
+    }
+
+    if isinstance(hashmethod, str) and hashmethod in validmethods:
+        return validmethods[hashmethod]()
+    if isinstance(hashmethod, BuiltinFunctionType):
+        return hashmethod()
+    raise ValueError(f"Invalid hash method provided: {hashmethod}")
+
+
 def generic_hash(
-    gid: str, hashmethod: Literal["md5", "sha256", "blake2d"] | Callable = "md5"
+    gid: str, hashmethod: Literal["md5", "sha256", "blake2b"] | Callable = "md5"
 ) -> str:
     """Return a unique hash ID for current instance.
 
@@ -149,19 +189,7 @@ def generic_hash(
     .. versionadded:: 2.14
 
     """
-    validmethods: dict[str, Callable] = {
-        "md5": hashlib.md5,
-        "sha256": hashlib.sha256,
-        "blake2b": hashlib.blake2b,
-    }
-
-    if isinstance(hashmethod, str) and hashmethod in validmethods:
-        mhash = validmethods[hashmethod]()
-    elif isinstance(hashmethod, BuiltinFunctionType):
-        mhash = hashmethod()
-    else:
-        raise ValueError(f"Invalid hash method provided: {hashmethod}")
-
+    mhash = _new_hash(hashmethod)
     mhash.update(gid.encode())
     return mhash.hexdigest()
 
@@ -345,17 +373,37 @@ class _XTGeoFile:
         if self.memstream or isinstance(self.file, (io.BytesIO, io.StringIO)):
             return True
 
-        if raisetext is None:
-            raisetext = f"File {self.name} does not exist or cannot be accessed"
-
-        if "r" in self._mode:
-            if not self.file.is_file() or not self.exists():
-                if raiseerror is not None:
-                    raise raiseerror(raisetext)
-                return False
+        # is_file() is a single stat and implies exists()
+        if "r" in self._mode and not self.file.is_file():
+            if raiseerror is not None:
+                if raisetext is None:
+                    # resolving the name is not free, only do it when needed
+                    raisetext = f"File {self.name} does not exist or cannot be accessed"
+                raise raiseerror(raisetext)
+            return False
 
         return True
 
+    def prefetch(self) -> None:
+        """Ask the OS to start reading the whole file into the page cache.
+
+        This is only a hint to overlap file I/O with other work; it does nothing
+        for memory streams, on platforms without ``posix_fadvise``, or if the
+        file cannot be opened.
+        """
+        if self.memstream or not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            fd = os.open(self.file, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
     def check_folder(
         self,
         raiseerror: type[Exception] | None = None,
@@ -427,7 +475,7 @@ class _XTGeoFile:
 
         """
         # Windows and pre-10.13 macOS lack fmemopen()
-        islinux = platform.system() == "Linux"
+        islinux = platform.system() == "Linux" and not self._fake_nofmem
 
         if self._cfhandle and "Swig Object of type 'FILE" in str(self._cfhandle):
             self._cfhandlecount += 1
@@ -443,9 +491,14 @@ class _XTGeoFile:
             elif self._mode == "rb" and not islinux:
                 # Write stream to a temporary file
                 fds, self._tmpfile = mkstemp(prefix="tmpxtgeoio")
-                os.close(fds)
-                with open(self._tmpfile, "wb") as newfile:
-                    newfile.write(self.file.getvalue())
+                try:
+                    # write the stream buffer as is, getvalue() would copy it first
+                    with os.fdopen(fds, "wb") as newfile, self.file.getbuffer() as buf:
+                        newfile.write(buf)
+                except BaseException:
+                    os.remove(self._tmpfile)
+                    self._tmpfile = None
+                    raise
 
         if self.memstream:
             if islinux:
@@ -489,11 +542,7 @@ class _XTGeoFile:
             )
             return False
 
-        if (
-            isinstance(self.file, io.BytesIO)
-            and self._cfhandle > 0
-            and "w" in self._mode
-        ):
+        if isinstance(self.file, io.BytesIO) and "w" in self._mode:
             # this assures that the file pointer is in the end of the current filehandle
             npos = _cxtgeo.xtg_ftell(self._cfhandle)
             buf = bytes(npos)
@@ -563,10 +612,11 @@ class _XTGeoFile:
             self.file.seek(0)
         else:
             assert isinstance(self.file, pathlib.Path)
-            if not self.exists():
-                raise ValueError(f"File {self.name} does not exist")
-            with open(self.file, "rb") as fhandle:
-                buf = fhandle.read(maxbuf)
+            try:
+                with open(self.file, "rb") as fhandle:
+                    buf = fhandle.read(maxbuf)
+            except FileNotFoundError as err:
+                raise ValueError(f"File {self.name} does not exist") from err
 
         if not isinstance(buf, bytes):
             return None
@@ -674,20 +724,10 @@ class _XTGeoFile:
 
         suffix = self.file.suffix[1:].lower()
 
-        for fmt, variants in SUPPORTED_FORMATS.items():
-            if suffix in variants:
-                logger.debug("Extension hints: %s", fmt)
-                return fmt
-
-        # if none of these above are accepted, check regular expression
-        # (intentional to complete all variant in loop above first before trying re())
-        for fmt, variants in SUPPORTED_FORMATS.items():
-            for var in variants:
-                if "*" in var:
-                    pattern = re.compile(var)
-                    if pattern.match(suffix):
-                        logger.debug("Extension by regexp hints %s", fmt)
-                        return fmt
+        fmt = _format_by_variant(suffix)
+        if fmt is not None:
+            logger.debug("Extension hints: %s", fmt)
+            return fmt
 
         return "unknown"
 
@@ -701,17 +741,9 @@ class _XTGeoFile:
     @staticmethod
     def generic_format_by_proposal(propose: str) -> str:
         """Get generic format by proposal."""
-        for fmt, variants in SUPPORTED_FORMATS.items():
-            if propose in variants:
-                return fmt
-
-        # if none of these above are accepted, check regular expression
-        for fmt, variants in SUPPORTED_FORMATS.items():
-            for var in variants:
-                if "*" in var:
-                    pattern = re.compile(var)
-                    if pattern.match(propose):
-                        return fmt
+        fmt = _format_by_variant(propose)
+        if fmt is not None:
+            return fmt
 
         raise ValueError(f"Non-supportred file extension: {propose}")
 
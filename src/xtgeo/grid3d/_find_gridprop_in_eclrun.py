@@ -271,11 +271,11 @@ def pick_dualporo_values(
 def valid_gridprop_lengths(grid):
     num_cells = np.prod(grid.dimensions)
     if grid.dualporo:
-        num_fracture = len(grid.get_dualactnum_indices(fracture=True))
-        num_matrix = len(grid.get_dualactnum_indices(fracture=False))
+        num_fracture = len(grid._get_dualactnum_indices(fracture=True, compact=True))
+        num_matrix = len(grid._get_dualactnum_indices(fracture=False, compact=True))
         return [2 * num_cells, num_fracture + num_matrix]
     else:
-        num_active = len(grid.get_actnum_indices())
+        num_active = len(grid._get_actnum_indices(compact=True))
         return [num_cells, num_active]
 
 
@@ -330,10 +330,12 @@ def make_gridprop_values(values, grid, fracture):
         values = expand_scalar_values(values, num_cells, grid.dualporo)
 
     if grid.dualporo:
-        actind = grid.get_dualactnum_indices(fracture=fracture, order="F")
+        actind = grid._get_dualactnum_indices(
+            fracture=fracture, order="F", compact=True
+        )
         values = pick_dualporo_values(values, actind, num_cells, fracture)
     else:
-        actind = grid.get_actnum_indices(order="F")
+        actind = grid._get_actnum_indices(order="F", compact=True)
 
     if len(values) != num_cells:
         values = match_values_to_active_cells(values, actind, num_cells)
@@ -539,6 +541,7 @@ def find_gridprops_from_restart_file_sections(
     first_date = None
     last_date = None
     read_properties = dict()
+    lengths = valid_gridprop_lengths(grid)
     for section in sections:
         intehead, logihead, section = peek_headers(section)
         check_grid_match(intehead, logihead, grid)
@@ -551,7 +554,7 @@ def find_gridprops_from_restart_file_sections(
         section_properties = {
             (name, date): gridprop_params(v, name, date, grid, fracture)
             for name, v in read_values(
-                section, intehead, names, lengths=valid_gridprop_lengths(grid)
+                section, intehead, names, lengths=lengths
             ).items()
         }
 
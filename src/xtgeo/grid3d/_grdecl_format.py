@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import warnings
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -14,6 +15,9 @@ if TYPE_CHECKING:
 
 logger = null_logger(__name__)
 
+# a comment is a word starting with "--" and lasts to the end of the line
+_COMMENT = re.compile(r"(?<!\S)--[^\n]*")
+
 
 def split_line(line: str) -> Generator[str, None, None]:
     """
@@ -74,6 +78,46 @@ def split_line_no_string(line: str) -> Generator[str, None, None]:
         yield w
 
 
+def read_simple_values(
+    grdecl_stream: TextIOWrapper, line: str
+) -> tuple[list[str] | None, int]:
+    """
+    Read the values of a simple keyword record, starting at the given line.
+
+    Same result as passing each line through split_line_no_string and each
+    word through interpret_token, but the record is split in one go, which is
+    much faster for large records such as ZCORN.
+
+    Returns the values and the number of lines read, including the line given.
+    The values are None if the stream ended before the terminating slash.
+
+    >>> import io
+    >>> read_simple_values(io.StringIO("3*1 -- a comment\\n 2 / 5\\n6 /"), "0 1\\n")
+    (['0', '1', '1', '1', '1', '2'], 3)
+
+    """
+    lines = []
+    nlines = 0
+    while line:
+        nlines += 1
+        if "/" in line:
+            words = list(split_line_no_string(line))
+            if "/" in words:
+                lines.append(" ".join(words[: words.index("/")]))
+                break
+        lines.append(line)
+        line = grdecl_stream.readline()
+    else:
+        return None, nlines
+
+    text = "".join(lines)
+    if "--" in text:
+        text = _COMMENT.sub("", text)
+    if "*" in text or "'" in text:
+        return [val for word in text.split() for val in interpret_token(word)], nlines
+    return text.split(), nlines
+
+
 def match_keyword(kw1: str, kw2: str) -> bool:
     """
     Perhaps surprisingly, the eclipse input format considers keywords
@@ -251,6 +295,13 @@ def open_grdecl(
                             f"Unrecognized keyword {repr(line)} on line {line_no}"
                         )
 
+            elif line_splitter is split_line_no_string:
+                words, nlines = read_simple_values(grdecl_stream, line)
+                line_no += nlines - 1
+                if words is not None:
+                    yield (keyword, words)
+                    keyword = None
+                words = []
             else:
                 for word in line_splitter(line):
                     if word == "/":
@@ -9,6 +9,8 @@ xtg = XTGeoDialog()
 class _Grid3D:
     """Abstract base class for Grid3D."""
 
+    __slots__ = ("_ncol", "_nrow", "_nlay")
+
     def __init__(self, ncol: int = 4, nrow: int = 3, nlay: int = 5):
         self._ncol = ncol
         self._nrow = nrow
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
+import time
 from typing import TYPE_CHECKING, Literal
 
 import numpy as np
@@ -12,10 +15,9 @@ import roffio
 from xtgeo import XTGeoCLibError, _cxtgeo
 from xtgeo.common import null_logger
 from xtgeo.common.constants import MAXDATES, MAXKEYWORDS
+from xtgeo.common.sys import _XTGeoFile
 
 if TYPE_CHECKING:
-    from xtgeo.common.sys import _XTGeoFile
-
     from .grid_properties import GridPropertiesKeywords, KeywordDateTuple, KeywordTuple
 
 logger = null_logger(__name__)
@@ -66,44 +68,113 @@ def scan_dates(
     Cf. grid_properties.py description
     """
 
-    seq = _cxtgeo.new_intarray(maxdates)
-    day = _cxtgeo.new_intarray(maxdates)
-    mon = _cxtgeo.new_intarray(maxdates)
-    yer = _cxtgeo.new_intarray(maxdates)
+    stat_key = _file_stat_key(pfile)
+    if stat_key is None:
+        sq, da = _scan_ecl_dates_arrays(pfile, maxdates)
+    else:
+        sq, da = _cached_ecl_dates_arrays(stat_key, maxdates)
+
+    zdates = list(zip(sq.tolist(), da.tolist()))
+
+    return (
+        pd.DataFrame.from_records(zdates, columns=["SEQNUM", "DATE"])
+        if dataframe
+        else zdates
+    )
+
+
+# record types translation (cf: grd3d_scan_eclbinary.c in cxtgeo), where the
+# type code is the index, and the code -1 ("????") is put at index 0
+_ECL_RECORD_TYPES = np.array(
+    ["????", "INTE", "REAL", "DOUB", "CHAR", "LOGI", "MESS"], dtype=object
+)
+
+_ECL_KEYWORD_COLUMNS = ["KEYWORD", "TYPE", "NITEMS", "BYTESTART"]
+
+
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def _file_stat_key(pfile: _XTGeoFile) -> tuple[str, int, int, int, int] | None:
+    """Return a key identifying the file and its content on disk.
+
+    None is returned for memory streams, files that cannot be stat'ed and files
+    modified too recently for the mtime to tell a rewrite apart (timestamps are
+    only updated once per kernel tick); such files are scanned without caching.
+    """
+    if pfile.memstream:
+        return None
+    fname = os.fspath(pfile.file)
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    if time.time_ns() - stat.st_mtime_ns < _RACY_MTIME_NS:
+        return None
+    return (fname, stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _readonly(*arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+# The scans below read through the whole file in C, and the same INIT/UNRST
+# file is typically scanned once per property import. Results are cached on
+# the file's stat key, so a rewritten file is scanned again.
+@functools.lru_cache(maxsize=128)
+def _cached_ecl_dates_arrays(
+    stat_key: tuple[str, int, int, int, int], maxdates: int
+) -> tuple[np.ndarray, ...]:
+    return _readonly(*_scan_ecl_dates_arrays(_XTGeoFile(stat_key[0]), maxdates))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_ecl_keyword_arrays(
+    stat_key: tuple[str, int, int, int, int], maxkeys: int
+) -> tuple[np.ndarray, ...]:
+    return _readonly(*_scan_ecl_keyword_arrays(_XTGeoFile(stat_key[0]), maxkeys))
+
+
+def _scan_ecl_dates_arrays(
+    pfile: _XTGeoFile, maxdates: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scan restart dates, returned as arrays of SEQNUM and YYYYMMDD date."""
+    # seqnum, day, month and year for each date, filled in place by C
+    tsteps = np.zeros((4, maxdates), dtype=np.int32)
 
     cfhandle = pfile.get_cfhandle()
 
-    nstat = _cxtgeo.grd3d_ecl_tsteps(cfhandle, seq, day, mon, yer, maxdates)
+    nstat = _cxtgeo.grd3d_ecl_tsteps(cfhandle, tsteps.ravel())
 
     pfile.cfclose()
 
-    sq = []
-    da = []
-    for i in range(nstat):
-        sq.append(_cxtgeo.intarray_getitem(seq, i))
-        dday = _cxtgeo.intarray_getitem(day, i)
-        dmon = _cxtgeo.intarray_getitem(mon, i)
-        dyer = _cxtgeo.intarray_getitem(yer, i)
-        date = f"{dyer:4}{dmon:02}{dday:02}"
-        da.append(int(date))
+    # make the YYYYMMDD dates with numpy
+    sq, dday, dmon, dyer = tsteps[:, :nstat].astype(np.int64)
+    return sq, dyer * 10000 + dmon * 100 + dday
 
-    for item in [seq, day, mon, yer]:
-        _cxtgeo.delete_intarray(item)
 
-    zdates = list(zip(sq, da))  # list for PY3
+def _ecl_keyword_arrays(
+    pfile: _XTGeoFile,
+    maxkeys: int = MAXKEYWORDS,
+) -> tuple[np.ndarray, ...]:
+    """Scan Eclipse keywords, returned as arrays of keyword, type, length and start.
 
-    return (
-        pd.DataFrame.from_records(zdates, columns=["SEQNUM", "DATE"])
-        if dataframe
-        else zdates
-    )
+    The arrays are the columns of the keyword table, so callers can make
+    either a dataframe or a list of tuples without an intermediate form.
+    They are shared with the scan cache and must not be modified.
+    """
+    stat_key = _file_stat_key(pfile)
+    if stat_key is None:
+        return _scan_ecl_keyword_arrays(pfile, maxkeys)
+    return _cached_ecl_keyword_arrays(stat_key, maxkeys)
 
 
-def _scan_ecl_keywords(
+def _scan_ecl_keyword_arrays(
     pfile: _XTGeoFile,
     maxkeys: int = MAXKEYWORDS,
-    dataframe: bool = False,
-) -> list[KeywordTuple] | pd.DataFrame:
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     cfhandle = pfile.get_cfhandle()
 
     # maxkeys*10 is used for 1D keywords; 10 => max 8 letters in eclipse +
@@ -124,32 +195,33 @@ def _scan_ecl_keywords(
         )
 
     keywords = re.sub(r"\s+\|", "|", keywords)
-    keywords = keywords.split("|")
-
-    # record types translation (cf: grd3d_scan_eclbinary.c in cxtgeo)
-    rct = {
-        1: "INTE",
-        2: "REAL",
-        3: "DOUB",
-        4: "CHAR",
-        5: "LOGI",
-        6: "MESS",
-        -1: "????",
-    }
-
-    rectypes = rectypes.tolist()
-    rc = [rct[key] for nn, key in enumerate(rectypes) if nn < nkeys]
-    rl = reclens[0:nkeys].tolist()
-    rs = recstarts[0:nkeys].tolist()
-
-    result = list(zip(keywords, rc, rl, rs))
+    names = np.array(keywords.split("|")[:nkeys], dtype=object)
+
+    rectypes = rectypes[:nkeys]
+    types = _ECL_RECORD_TYPES[np.where(rectypes < 0, 0, rectypes)]
+
+    return (
+        names,
+        types,
+        reclens[:nkeys].astype(np.int64),
+        recstarts[:nkeys].astype(np.int64),
+    )
+
+
+def _scan_ecl_keywords(
+    pfile: _XTGeoFile,
+    maxkeys: int = MAXKEYWORDS,
+    dataframe: bool = False,
+) -> list[KeywordTuple] | pd.DataFrame:
+    columns = _ecl_keyword_arrays(pfile, maxkeys=maxkeys)
 
     if dataframe:
-        cols = ["KEYWORD", "TYPE", "NITEMS", "BYTESTART"]
-        df = pd.DataFrame.from_records(result, columns=cols)
-        return df
+        return pd.DataFrame(dict(zip(_ECL_KEYWORD_COLUMNS, columns)))
 
-    return result
+    names, types, reclens, recstarts = columns
+    return list(
+        zip(names.tolist(), types.tolist(), reclens.tolist(), recstarts.tolist())
+    )
 
 
 def _scan_ecl_keywords_w_dates(
@@ -158,30 +230,31 @@ def _scan_ecl_keywords_w_dates(
     dataframe: bool = False,
 ) -> list[KeywordDateTuple] | pd.DataFrame:
     """Add a date column to the keyword"""
-    xkeys = _scan_ecl_keywords(pfile, maxkeys=maxkeys, dataframe=False)
-    assert isinstance(xkeys, list)
+    names, types, reclens, recstarts = _ecl_keyword_arrays(pfile, maxkeys=maxkeys)
     xdates = scan_dates(pfile, maxdates=MAXDATES, dataframe=False)
     assert isinstance(xdates, list)
 
-    result = []
-    # now merge these two:
-    nv = -1
-    date = 0
-    for item in xkeys:
-        name, dtype, reclen, bytepos = item
-        if name == "SEQNUM":
-            nv += 1
-            date = xdates[nv][1]
-
-        entry = (name, dtype, reclen, bytepos, date)
-        result.append(entry)
+    # each SEQNUM keyword starts a new report step, and keywords before the
+    # first SEQNUM get date 0
+    seqnum_count = np.cumsum(names == "SEQNUM")
+    alldates = np.array([0] + [date for _, date in xdates], dtype=np.int64)
+    if seqnum_count.size and seqnum_count[-1] >= alldates.size:
+        raise IndexError("More SEQNUM keywords than dates in file")
+    dates = alldates[seqnum_count]
 
     if dataframe:
-        cols = ["KEYWORD", "TYPE", "NITEMS", "BYTESTART", "DATE"]
-        df = pd.DataFrame.from_records(result, columns=cols)
-        return df
-
-    return result
+        cols = _ECL_KEYWORD_COLUMNS + ["DATE"]
+        return pd.DataFrame(dict(zip(cols, (names, types, reclens, recstarts, dates))))
+
+    return list(
+        zip(
+            names.tolist(),
+            types.tolist(),
+            reclens.tolist(),
+            recstarts.tolist(),
+            dates.tolist(),
+        )
+    )
 
 
 def _scan_roff_keywords(
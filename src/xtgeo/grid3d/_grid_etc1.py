@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import OrderedDict
 from copy import deepcopy
 from math import atan2, degrees
+from threading import local
 
 import numpy as np
 import numpy.ma as ma
@@ -23,6 +24,9 @@ from .grid_property import GridProperty
 
 logger = null_logger(__name__)
 
+# per thread scratch buffers for C routines called once per cell
+_scratch = local()
+
 
 # Note that "self" is the grid instance
 
@@ -78,12 +82,26 @@ method_factory = {
 }
 
 
+def _check_float_dtype(dtype):
+    """Only float64 (default) and float32 are supported for geometry properties."""
+    if dtype not in (np.float64, np.float32):
+        raise ValueError(f"The dtype must be np.float64 or np.float32, not {dtype}")
+
+
+def _as_dtype(props, dtype):
+    """Store the values of geometry properties as dtype; computation is in double."""
+    if dtype != np.float64:
+        for prop in props:
+            prop.values = prop.values.astype(dtype)
+
+
 def get_dz(
     self,
     name: str = "dZ",
     flip: bool = True,
     asmasked: bool = True,
     metric="z projection",
+    dtype=np.float64,
 ) -> GridProperty:
     """Get average cell height (dz) as property.
 
@@ -92,7 +110,9 @@ def get_dz(
             increasing depth (defaults to True)
         asmasked (bool): Whether to mask property by whether
         name (str): Name of resulting grid property, defaults to "dZ".
+        dtype: Value dtype of the property, np.float64 (default) or np.float32.
     """
+    _check_float_dtype(dtype)
     self._xtgformat2()
     nx, ny, nz = self.dimensions
     result = np.zeros(nx * ny * nz)
@@ -118,7 +138,7 @@ def get_dz(
     else:
         result = np.ma.masked_array(result, False)
 
-    return GridProperty(
+    prop = GridProperty(
         ncol=self._ncol,
         nrow=self._nrow,
         nlay=self._nlay,
@@ -126,9 +146,12 @@ def get_dz(
         name=name,
         discrete=False,
     )
+    _as_dtype([prop], dtype)
+    return prop
 
 
-def get_dx(self, name="dX", asmasked=False, metric="horizontal"):
+def get_dx(self, name="dX", asmasked=False, metric="horizontal", dtype=np.float64):
+    _check_float_dtype(dtype)
     try:
         metric_fun = method_factory[metric]
     except KeyError as err:
@@ -150,7 +173,7 @@ def get_dx(self, name="dX", asmasked=False, metric="horizontal"):
         result = np.ma.masked_array(result, self._actnumsv == 0)
     else:
         result = np.ma.masked_array(result, False)
-    return GridProperty(
+    prop = GridProperty(
         ncol=self._ncol,
         nrow=self._nrow,
         nlay=self._nlay,
@@ -158,9 +181,12 @@ def get_dx(self, name="dX", asmasked=False, metric="horizontal"):
         name=name,
         discrete=False,
     )
+    _as_dtype([prop], dtype)
+    return prop
 
 
-def get_dy(self, name="dX", asmasked=False, metric="horizontal"):
+def get_dy(self, name="dX", asmasked=False, metric="horizontal", dtype=np.float64):
+    _check_float_dtype(dtype)
     try:
         metric_fun = method_factory[metric]
     except KeyError as err:
@@ -182,7 +208,7 @@ def get_dy(self, name="dX", asmasked=False, metric="horizontal"):
         result = np.ma.masked_array(result, self._actnumsv == 0)
     else:
         result = np.ma.masked_array(result, False)
-    return GridProperty(
+    prop = GridProperty(
         ncol=self._ncol,
         nrow=self._nrow,
         nlay=self._nlay,
@@ -190,6 +216,34 @@ def get_dy(self, name="dX", asmasked=False, metric="horizontal"):
         name=name,
         discrete=False,
     )
+    _as_dtype([prop], dtype)
+    return prop
+
+
+def _get_dxdydz_values(self, metrics=("horizontal", "horizontal", "z projection")):
+    """Get dx, dy and dz values as one (3, ntotal) array, from a single C pass.
+
+    Same values as get_dx(), get_dy() and get_dz() (unmasked, flip=True) with the
+    given metrics, but zcorn is converted and traversed once instead of three times.
+    """
+    try:
+        metric_funs = [method_factory[metric] for metric in metrics]
+    except KeyError as err:
+        raise ValueError(f"Unknown metric {err.args[0]}") from err
+    self._xtgformat2()
+    dxdydz = np.zeros((3, self.ntotal))
+    _cxtgeo.grdcp3d_calc_dxdydz(
+        self._ncol,
+        self._nrow,
+        self._nlay,
+        self._coordsv.ravel(),
+        self._zcornsv.ravel(),
+        dxdydz[0],
+        dxdydz[1],
+        dxdydz[2],
+        *metric_funs,
+    )
+    return dxdydz
 
 
 def get_bulk_volume(self, name="bulkvol", asmasked=True, precision=2):
@@ -232,51 +286,35 @@ def get_bulk_volume(self, name="bulkvol", asmasked=True, precision=2):
 def get_ijk(self, names=("IX", "JY", "KZ"), asmasked=True, zerobased=False):
     """Get I J K as properties."""
     ashape = (self._ncol, self._nrow, self._nlay)
+    start = 0 if zerobased else 1
 
-    ix, jy, kz = np.indices(ashape)
-
-    ix = ix.ravel()
-    jy = jy.ravel()
-    kz = kz.ravel()
-
+    inactive = None
     if asmasked:
-        actnum = self.get_actnum()
-
-        ix = ma.masked_where(actnum.values1d == 0, ix)
-        jy = ma.masked_where(actnum.values1d == 0, jy)
-        kz = ma.masked_where(actnum.values1d == 0, kz)
-
-    if not zerobased:
-        ix += 1
-        jy += 1
-        kz += 1
-
-    ix = GridProperty(
-        ncol=self._ncol,
-        nrow=self._nrow,
-        nlay=self._nlay,
-        values=ix.reshape(ashape),
-        name=names[0],
-        discrete=True,
-    )
-    jy = GridProperty(
-        ncol=self._ncol,
-        nrow=self._nrow,
-        nlay=self._nlay,
-        values=jy.reshape(ashape),
-        name=names[1],
-        discrete=True,
-    )
-    kz = GridProperty(
-        ncol=self._ncol,
-        nrow=self._nrow,
-        nlay=self._nlay,
-        values=kz.reshape(ashape),
-        name=names[2],
-        discrete=True,
-    )
+        inactive = self.get_actnum().values == 0
+
+    result = []
+    for axis, name in enumerate(names):
+        # broadcast the counter along each axis straight into an int32 array,
+        # instead of making all three int64 index arrays and adding 1 after
+        shape = [1, 1, 1]
+        shape[axis] = ashape[axis]
+        counter = np.arange(start, ashape[axis] + start, dtype=np.int32)
+        values = np.broadcast_to(counter.reshape(shape), ashape).copy()
+        if inactive is not None:
+            values = ma.masked_where(inactive, values, copy=False)
+
+        result.append(
+            GridProperty(
+                ncol=self._ncol,
+                nrow=self._nrow,
+                nlay=self._nlay,
+                values=values,
+                name=name,
+                discrete=True,
+            )
+        )
 
-    # return the objects
+    ix, jy, kz = result
     return ix, jy, kz
 
 
@@ -296,7 +334,6 @@ def get_ijk_from_points(
     It is here tried to get fast execution. This requires a preprosessing
     of the grid to store a onlayer version, and maps with IJ positions
     """
-    self._xtgformat1()
     logger.info("Getting IJK indices from Points...")
 
     actnumoption = 1
@@ -313,6 +350,8 @@ def get_ijk_from_points(
 
     logger.info("Grid FLIP for C code is %s", useflip)
 
+    # the steps above may work on xtgformat 2, the C routine needs xtgformat 1
+    self._xtgformat1()
     logger.info("Running C routine...")
     _, iarr, jarr, karr = _cxtgeo.grd3d_points_ijk_cells(
         points.dataframe[points.xname].values,
@@ -380,9 +419,12 @@ def get_ijk_from_points(
     return result
 
 
-def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True):
+def get_xyz(
+    self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True, dtype=np.float64
+):
     """Get X Y Z as properties."""
     # TODO: May be issues with asmasked vs activeonly here?
+    _check_float_dtype(dtype)
     self._xtgformat2()
 
     option: int = 0
@@ -433,116 +475,87 @@ def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True):
         discrete=False,
     )
 
+    _as_dtype((xo, yo, zo), dtype)
     return xo, yo, zo
 
 
+def _integer_ijk(ijk):
+    """Return ijk as an array, raise ValueError unless it holds integers."""
+    ijk = np.asarray(ijk)
+    if not np.issubdtype(ijk.dtype, np.integer):
+        raise ValueError(f"The ijk indices must be integers, got dtype {ijk.dtype}")
+    return ijk
+
+
 def get_xyz_cell_corners(self, ijk=(1, 1, 1), activeonly=True, zerobased=False):
     """Get X Y Z cell corners for one cell."""
-    self._xtgformat1()
+    # use xtgformat 2 directly; converting the whole grid to xtgformat 1 and back
+    # for one cell cost far more than the cell itself
+    self._xtgformat2()
 
-    i, j, k = ijk
+    shift = 0 if zerobased else 1
+    i, j, k = (int(idx) - shift for idx in _integer_ijk(ijk))
+    if not (0 <= i < self._ncol and 0 <= j < self._nrow and 0 <= k < self._nlay):
+        raise ValueError(f"The cell {tuple(ijk)} is outside the grid")
 
-    shift = 0
-    if zerobased:
-        shift = 1
+    if activeonly and self._actnumsv[i, j, k] == 0:
+        return None
 
-    if activeonly:
-        actnum = self.get_actnum()
-        iact = actnum.values3d[i - 1 + shift, j - 1 + shift, k - 1 + shift]
-        if iact == 0:
-            return None
+    # the corners are written straight into a numpy array, no SWIG carray needed
+    corners = np.empty(24)
+    _cxtgeo.grdcp3d_corners_batch(
+        self._ncol,
+        self._nrow,
+        self._nlay,
+        self._coordsv.ravel(),
+        self._zcornsv.ravel(),
+        np.array((i, j, k), dtype=np.int32),
+        corners,
+    )
+    return tuple(corners.tolist())
 
-    pcorners = _cxtgeo.new_doublearray(24)
 
-    if self._xtgformat == 1:
-        logger.info("Use xtgformat 1...")
-        _cxtgeo.grd3d_corners(
-            i + shift,
-            j + shift,
-            k + shift,
-            self.ncol,
-            self.nrow,
-            self.nlay,
-            self._coordsv,
-            self._zcornsv,
-            pcorners,
-        )
-    else:
-        logger.info("Use xtgformat 2...")
-        _cxtgeo.grdcp3d_corners(
-            i + shift - 1,
-            j + shift - 1,
-            k + shift - 1,
-            self.ncol,
-            self.nrow,
-            self.nlay,
-            self._coordsv,
-            self._zcornsv,
-            pcorners,
-        )
+def get_xyz_cell_corners_batch(self, ijk, activeonly=True, zerobased=False):
+    """Get X Y Z cell corners for many cells, as an array with shape (M, 24)."""
+    self._xtgformat2()
 
-    cornerlist = []
-    for i in range(24):
-        cornerlist.append(_cxtgeo.doublearray_getitem(pcorners, i))
+    # a copy, as it is shifted in place below; bounds are checked before int32
+    ijk = np.array(_integer_ijk(ijk), dtype=np.int64, ndmin=2)
+    if ijk.ndim != 2 or ijk.shape[1] != 3:
+        raise ValueError(f"The ijk array must have shape (M, 3), got {ijk.shape}")
+    if not zerobased:
+        ijk -= 1
+    if np.any(ijk < 0) or np.any(ijk >= np.array(self.dimensions)):
+        raise ValueError("One or more cell indices in ijk are outside the grid")
+    ijk = ijk.astype(np.int32)
 
-    clist = tuple(cornerlist)
-    return clist
+    corners = np.empty((len(ijk), 24), dtype=np.float64)
+    _cxtgeo.grdcp3d_corners_batch(
+        self._ncol,
+        self._nrow,
+        self._nlay,
+        self._coordsv,
+        self._zcornsv,
+        ijk.ravel(),
+        corners.ravel(),
+    )
+
+    if activeonly:
+        corners[self._actnumsv[ijk[:, 0], ijk[:, 1], ijk[:, 2]] == 0] = np.nan
+    return corners
 
 
-def get_xyz_corners(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS")):
+def get_xyz_corners(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), dtype=np.float64):
     """Get X Y Z cell corners for all cells (as 24 GridProperty objects)."""
+    _check_float_dtype(dtype)
     self._xtgformat1()
 
-    ntot = (self._ncol, self._nrow, self._nlay)
-
-    grid_props = []
-
-    for i in range(0, 8):
-        xname = names[0] + str(i)
-        yname = names[1] + str(i)
-        zname = names[2] + str(i)
-        x = GridProperty(
-            ncol=self._ncol,
-            nrow=self._nrow,
-            nlay=self._nlay,
-            values=np.zeros(ntot, dtype=np.float64),
-            name=xname,
-            discrete=False,
-        )
-
-        y = GridProperty(
-            ncol=self._ncol,
-            nrow=self._nrow,
-            nlay=self._nlay,
-            values=np.zeros(ntot, dtype=np.float64),
-            name=yname,
-            discrete=False,
-        )
-
-        z = GridProperty(
-            ncol=self._ncol,
-            nrow=self._nrow,
-            nlay=self._nlay,
-            values=np.zeros(ntot, dtype=np.float64),
-            name=zname,
-            discrete=False,
-        )
-
-        grid_props.append(x)
-        grid_props.append(y)
-        grid_props.append(z)
-
-    ptr_coord = []
-    for i in range(24):
-        some = _cxtgeo.new_doublearray(self.ntotal)
-        ptr_coord.append(some)
-
-    for i, va in enumerate(ptr_coord):
-        logger.debug("SWIG object %s   %s", i, va)
+    # all corners in one array, one row per corner component in the order
+    # x1, y1, z1, ... x8, y8, z8, each row in F order
+    corners = np.empty((24, self.ntotal), dtype=np.float64)
 
     option = 0
 
-    # note, fool the argument list to unpack ptr_coord with * ...
     _cxtgeo.grd3d_get_all_corners(
         self._ncol,
         self._nrow,
@@ -550,23 +563,25 @@ def get_xyz_corners(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS")):
         self._coordsv,
         self._zcornsv,
         self._actnumsv,
-        *(ptr_coord + [option]),
+        corners.ravel(),
+        option,
     )
 
-    for i in range(0, 24, 3):
-        _gridprop_lowlevel.update_values_from_carray(
-            grid_props[i], ptr_coord[i], np.float64, delete=True
-        )
-
-        _gridprop_lowlevel.update_values_from_carray(
-            grid_props[i + 1], ptr_coord[i + 1], np.float64, delete=True
-        )
-
-        _gridprop_lowlevel.update_values_from_carray(
-            grid_props[i + 2], ptr_coord[i + 2], np.float64, delete=True
+    grid_props = []
+    for i, values in enumerate(corners):
+        prop = GridProperty(
+            ncol=self._ncol,
+            nrow=self._nrow,
+            nlay=self._nlay,
+            values=_gridprop_lowlevel.f2c_order(self, values),
+            name=names[i % 3] + str(i // 3),
+            discrete=False,
         )
+        prop.mask_undef()
+        grid_props.append(prop)
 
     # return the 24 objects (x1, y1, z1, ... x8, y8, z8)
+    _as_dtype(grid_props, dtype)
     return tuple(grid_props)
 
 
@@ -656,7 +671,7 @@ def get_cell_volume(self, ijk=(1, 1, 1), activeonly=True, zerobased=False, preci
         if iact == 0:
             return None
 
-    pcorners = _cxtgeo.new_doublearray(24)
+    pcorners = _corner_scratch()
 
     if self._xtgformat == 1:
         logger.info("Use xtgformat 1...")
@@ -689,6 +704,13 @@ def get_cell_volume(self, ijk=(1, 1, 1), activeonly=True, zerobased=False, preci
     return cellvol
 
 
+def _corner_scratch():
+    """Return a 24 double C array for one cell's corners, reused within a thread."""
+    if not hasattr(_scratch, "corners"):
+        _scratch.corners = _cxtgeo.new_doublearray(24)
+    return _scratch.corners
+
+
 def get_layer_slice(self, layer, top=True, activeonly=True):
     """Get X Y cell corners (XY per cell; 5 per cell) as array."""
     self._xtgformat1()
@@ -740,10 +762,6 @@ def get_geometrics(self, allcells=False, cellcenter=True, return_dict=False, _ve
 
 
 def _get_geometrics_v1(self, allcells=False, cellcenter=True, return_dict=False):
-    ptr_x = []
-    for i in range(13):
-        ptr_x.append(_cxtgeo.new_doublepointer())
-
     option1 = 1
     if allcells:
         option1 = 0
@@ -752,34 +770,20 @@ def _get_geometrics_v1(self, allcells=False, cellcenter=True, return_dict=False)
     if not cellcenter:
         option2 = 0
 
-    quality = _cxtgeo.grd3d_geometrics(
+    # the 13 geometrics come back in one array, in the order of gkeys below
+    quality, geometrics = _cxtgeo.grd3d_geometrics(
         self._ncol,
         self._nrow,
         self._nlay,
         self._coordsv,
         self._zcornsv,
         self._actnumsv,
-        ptr_x[0],
-        ptr_x[1],
-        ptr_x[2],
-        ptr_x[3],
-        ptr_x[4],
-        ptr_x[5],
-        ptr_x[6],
-        ptr_x[7],
-        ptr_x[8],
-        ptr_x[9],
-        ptr_x[10],
-        ptr_x[11],
-        ptr_x[12],
+        13,
         option1,
         option2,
     )
 
-    glist = []
-    for i in range(13):
-        glist.append(_cxtgeo.doublepointer_value(ptr_x[i]))
-
+    glist = geometrics.tolist()
     glist.append(quality)
 
     logger.info("Cell geometrics done")
@@ -837,12 +841,10 @@ def _get_geometrics_v2(self, allcells=False, cellcenter=True, return_dict=False)
         y1 = ycor.values[self.ncol - 1, midcol, midlay]
         glist.append(degrees(atan2(y1 - y0, x1 - x0)))
 
-        dx = self.get_dx(asmasked=False)
-        dy = self.get_dy(asmasked=False)
-        dz = self.get_dz(asmasked=False)
-        glist.append(dx.values.mean())
-        glist.append(dy.values.mean())
-        glist.append(dz.values.mean())
+        dx, dy, dz = _get_dxdydz_values(self)
+        glist.append(dx.mean())
+        glist.append(dy.mean())
+        glist.append(dz.mean())
         glist.append(1)
 
     if return_dict:
@@ -906,6 +908,26 @@ def make_zconsistent(self, zsep):
     )
 
 
+def _polygons_xy_flagged(poly):
+    """Get X and Y of the polygons as contiguous arrays, each polygon ended by 999.
+
+    Same point order as ``poly.get_xyz_dataframe()``, but without building the
+    intermediate dataframe.
+    """
+    dfr = poly.dataframe
+    pid = dfr[poly.pname].to_numpy()
+    if pid.size == 0:
+        return np.zeros(0, dtype=np.float64), np.zeros(0, dtype=np.float64)
+
+    order = np.argsort(pid, kind="stable")
+    pid = pid[order]
+    ends = np.append(np.flatnonzero(pid[1:] != pid[:-1]) + 1, pid.size)
+
+    xc = np.insert(dfr[poly.xname].to_numpy(dtype=np.float64)[order], ends, 999.0)
+    yc = np.insert(dfr[poly.yname].to_numpy(dtype=np.float64)[order], ends, 999.0)
+    return xc, yc
+
+
 def inactivate_inside(self, poly, layer_range=None, inside=True, force_close=False):
     """Inactivate inside a polygon (or outside)."""
     self._xtgformat1()
@@ -927,11 +949,8 @@ def inactivate_inside(self, poly, layer_range=None, inside=True, force_close=Fal
     if force_close:
         iforce = 1
 
-    # get dataframe where each polygon is ended by a 999 value
-    dfxyz = poly.get_xyz_dataframe()
-
-    xc = dfxyz["X_UTME"].values.copy()
-    yc = dfxyz["Y_UTMN"].values.copy()
+    # get x y arrays where each polygon is ended by a 999 value
+    xc, yc = _polygons_xy_flagged(poly)
 
     ier = _cxtgeo.grd3d_inact_outside_pol(
         xc,
@@ -1166,11 +1185,11 @@ def translate_coordinates(self, translate=(0, 0, 0), flip=(1, 1, 1)):
 
 def reverse_row_axis(self, ijk_handedness=None):
     """Reverse rows (aka flip) for geometry and assosiated properties."""
-    self._xtgformat1()
-
     if ijk_handedness == self.ijk_handedness:
         return
 
+    self._xtgformat1()
+
     ier = _cxtgeo.grd3d_reverse_jrows(
         self._ncol,
         self._nrow,
@@ -1204,17 +1223,8 @@ def get_adjacent_cells(self, prop, val1, val2, activeonly=True):
     if prop.isdiscrete is False:
         raise ValueError("The argument prop is not a discrete property")
 
-    result = GridProperty(
-        ncol=self._ncol,
-        nrow=self._nrow,
-        nlay=self._nlay,
-        values=np.zeros(self.ntotal, dtype=np.int32),
-        name="ADJ_CELLS",
-        discrete=True,
-    )
-
-    p_prop1 = _gridprop_lowlevel.update_carray(prop)
-    p_prop2 = _cxtgeo.new_intarray(self.ntotal)
+    prop1 = prop.get_npvalues1d(fill_value=xtgeo.UNDEF_INT, order="F")
+    prop2 = np.empty(self.ntotal, dtype=np.int32)
 
     iflag1 = 1
     if activeonly:
@@ -1229,17 +1239,23 @@ def get_adjacent_cells(self, prop, val1, val2, activeonly=True):
         self._coordsv,
         self._zcornsv,
         self._actnumsv,
-        p_prop1,
-        self.ntotal,
+        prop1.astype(np.int32),
         val1,
         val2,
-        p_prop2,
-        self.ntotal,
+        prop2,
         iflag1,
         iflag2,
     )
 
-    _gridprop_lowlevel.update_values_from_carray(result, p_prop2, np.int32, delete=True)
+    result = GridProperty(
+        ncol=self._ncol,
+        nrow=self._nrow,
+        nlay=self._nlay,
+        values=_gridprop_lowlevel.f2c_order(self, prop2),
+        name="ADJ_CELLS",
+        discrete=True,
+    )
+    result.mask_undef()
     # return the property object
     return result
 
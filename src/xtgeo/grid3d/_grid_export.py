@@ -5,6 +5,7 @@ from copy import deepcopy
 
 import h5py
 import hdf5plugin
+import numpy as np
 import roffio
 
 from xtgeo.common import null_logger
@@ -176,13 +177,10 @@ def _transform_vectors(self, meta, dtypecoo, dtypezco, dtypeact):
     zshift = meta["_required_"]["zshift"]
 
     if xshift != 0.0 or yshift != 0.0 or zshift != 0.0:
-        coordsv = self._coordsv.copy()
-        zcornsv = self._zcornsv.copy()
+        # the 6 coordsv values per pillar are x, y, z for top and base
+        coordsv = self._coordsv - np.tile([xshift, yshift, zshift], 2)
+        zcornsv = self._zcornsv - np.float32(zshift)
         actnumsv = self._actnumsv.copy()
-        coordsv[:, :, 0::3] -= xshift
-        coordsv[:, :, 1::3] -= yshift
-        coordsv[:, :, 2::3] -= zshift
-        zcornsv -= zshift
     else:
         coordsv = self._coordsv
         zcornsv = self._zcornsv
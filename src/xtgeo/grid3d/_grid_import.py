@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Grid import functions for various formats."""
 
+import functools
+
 import xtgeo
 from xtgeo.common import null_logger
 from xtgeo.grid3d import _grid_import_ecl, _grid_import_roff
@@ -9,8 +11,23 @@ from . import _grid_import_xtgcpgeom
 
 logger = null_logger(__name__)
 
+# importers by generic file format, each returns Grid constructor arguments
+_IMPORTERS = {
+    "roff_binary": _grid_import_roff.import_roff,
+    "roff_ascii": _grid_import_roff.import_roff,
+    "egrid": functools.partial(_grid_import_ecl.import_ecl_egrid, fileformat="egrid"),
+    "fegrid": functools.partial(_grid_import_ecl.import_ecl_egrid, fileformat="fegrid"),
+    "grdecl": _grid_import_ecl.import_ecl_grdecl,
+    "bgrdecl": _grid_import_ecl.import_ecl_bgrdecl,
+    "xtg": _grid_import_xtgcpgeom.import_xtgcpgeom,
+    "hdf": _grid_import_xtgcpgeom.import_hdf5_cpgeom,
+}
+
+# binary formats where the importer reads the file from start to end
+_PREFETCHED = {"roff_binary", "egrid", "fegrid", "bgrdecl", "xtg"}
 
-def from_file(gfile, fformat=None, **kwargs):  # pylint: disable=too-many-branches
+
+def from_file(gfile, fformat=None, **kwargs):
     """Import grid geometry from file, and makes an instance of this class.
 
     Returns:
@@ -30,22 +47,11 @@ def from_file(gfile, fformat=None, **kwargs):  # pylint: disable=too-many-branch
 
     gfile.check_file(raiseerror=IOError, raisetext=f"Cannot access file {gfile.name}")
 
-    if fformat in ["roff_binary", "roff_ascii"]:
-        result.update(_grid_import_roff.import_roff(gfile, **kwargs))
-    elif fformat in ["egrid", "fegrid"]:
-        result.update(
-            _grid_import_ecl.import_ecl_egrid(gfile, fileformat=fformat, **kwargs)
-        )
-    elif fformat == "grdecl":
-        result.update(_grid_import_ecl.import_ecl_grdecl(gfile, **kwargs))
-    elif fformat == "bgrdecl":
-        result.update(_grid_import_ecl.import_ecl_bgrdecl(gfile, **kwargs))
-    elif fformat == "xtg":
-        result.update(_grid_import_xtgcpgeom.import_xtgcpgeom(gfile, **kwargs))
-    elif fformat == "hdf":
-        result.update(_grid_import_xtgcpgeom.import_hdf5_cpgeom(gfile, **kwargs))
-    else:
+    if fformat not in _IMPORTERS:
         raise ValueError(f"Invalid file format: {fformat}")
+    if fformat in _PREFETCHED:
+        gfile.prefetch()
+    result.update(_IMPORTERS[fformat](gfile, **kwargs))
 
     if gfile.memstream:
         result["name"] = "unknown"
@@ -34,6 +34,17 @@ def import_ecl_egrid(
 # Import eclipse run suite: EGRID + properties from INIT and UNRST
 # For the INIT and UNRST, props dates shall be selected
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def prefetch_ecl_run(groot, initprops=None, **_):
+    """Ask the OS to start reading the INIT file of an ECL run in the background.
+
+    Called before the EGRID is parsed so that the two reads overlap. The
+    UNRST file is read sparsely (only the requested dates) and is not
+    prefetched.
+    """
+    if initprops:
+        xtgeo._XTGeoFile(groot + ".INIT").prefetch()
+
+
 def import_ecl_run(
     groot, ecl_grid, initprops=None, restartprops=None, restartdates=None
 ):
@@ -44,27 +55,28 @@ def import_ecl_run(
     ecl_init = xtgeo._XTGeoFile(ecl_init)
     ecl_rsta = xtgeo._XTGeoFile(ecl_rsta)
 
-    grdprops = xtgeo.grid3d.GridProperties()
+    props = []
 
     # import the init properties unless list is empty
     if initprops:
-        initprops = xtgeo.gridproperties_from_file(
+        init_gridprops = xtgeo.gridproperties_from_file(
             ecl_init.name, names=initprops, fformat="init", dates=None, grid=ecl_grid
         )
-        grdprops.append_props(initprops.props)
+        props += init_gridprops.props
 
     # import the restart properties for dates unless lists are empty
     if restartprops and restartdates:
-        restartprops = xtgeo.gridproperties_from_file(
+        restart_gridprops = xtgeo.gridproperties_from_file(
             ecl_rsta.name,
             names=restartprops,
             fformat="unrst",
             dates=restartdates,
             grid=ecl_grid,
         )
-        grdprops.append_props(restartprops.props)
+        props += restart_gridprops.props
 
-    ecl_grid.gridprops = grdprops
+    # one consistency check and name index for all properties
+    ecl_grid.gridprops = xtgeo.grid3d.GridProperties(props=props)
 
 
 def import_ecl_grdecl(gfile, relative_to=GridRelative.MAP):
@@ -1,8 +1,8 @@
 # coding: utf-8
 """Private module, Grid Import private functions for ROFF format."""
 
+import io
 import pathlib
-import tempfile
 import warnings
 from contextlib import contextmanager
 
@@ -43,6 +43,53 @@ def replace_xtgeo_214_header(header):
     return header[:143] + b"\0" + header[143:]
 
 
+class _HeaderReplacedStream(io.RawIOBase):
+    """
+    Read only, seekable view of a binary stream where the bytes before offset
+    are replaced by header, which may have another length.
+
+    The stream itself is read on demand, so large grid files are neither
+    copied to a temporary file nor read into memory.
+    """
+
+    def __init__(self, header: bytes, stream: io.IOBase, offset: int) -> None:
+        self._header = header
+        self._stream = stream
+        self._offset = offset
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += len(self._header) + self._stream.seek(0, io.SEEK_END)
+            pos -= self._offset
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        nread = 0
+        if self._pos < len(self._header):
+            part = self._header[self._pos : self._pos + len(view)]
+            view[: len(part)] = part
+            nread = len(part)
+        if nread < len(view):
+            self._stream.seek(self._offset + self._pos + nread - len(self._header))
+            nread += self._stream.readinto(view[nread:])
+        self._pos += nread
+        return nread
+
+
 @contextmanager
 def handle_deprecated_xtgeo_roff_file(filelike):
     """
@@ -84,16 +131,15 @@ def handle_deprecated_xtgeo_roff_file(filelike):
         )
         new_header = replace_xtgeo_214_header(header)
 
-        with tempfile.NamedTemporaryFile() as outhandle:
-            outhandle.write(new_header)
-            inhandle.seek(200)
-            outhandle.write(inhandle.read())
-            outhandle.seek(0)
-            yield outhandle
-            if close:
-                inhandle.close()
-            else:
-                inhandle.seek(goback)
+        # the rest of the file is read in place, grid files may be too large
+        # to copy or read into memory
+        yield io.BufferedReader(
+            _HeaderReplacedStream(new_header, inhandle, goback + len(header))
+        )
+        if close:
+            inhandle.close()
+        else:
+            inhandle.seek(goback)
 
     else:
         if close:
@@ -1,6 +1,7 @@
 # coding: utf-8
 """Private module, Grid Import private functions for xtgeo based formats."""
 
+import io
 import json
 from collections import OrderedDict
 from struct import unpack
@@ -44,27 +45,26 @@ def convert_subgrids(sdict):
 def handle_metadata(result, meta, ncol, nrow, nlay):
     # meta _optional_ *may* contain xshift, xscale etc which in case must be taken
     # into account
-    coordsv = result["coordsv"]
+    # convert first, so the shift is added in float64 and never applied in
+    # place on a read-only memmap
+    coordsv = result["coordsv"].astype(np.float64)
     zcornsv = result["zcornsv"]
     actnumsv = result["actnumsv"]
     nncol = ncol + 1
     nnrow = nrow + 1
     nnlay = nlay + 1
     req = meta["_required_"]
-    shi = req["xshift"]
-    coordsv[0::3] = np.where(shi != 0, coordsv[0::3] + shi, coordsv[0::3])
-    sca = req["xscale"]
-    coordsv[0::3] = np.where(sca != 1, coordsv[0::3] * sca, coordsv[0::3])
-    shi = req["yshift"]
-    coordsv[1::3] = np.where(shi != 0, coordsv[1::3] + shi, coordsv[1::3])
-    sca = req["yscale"]
-    coordsv[1::3] = np.where(sca != 1, coordsv[1::3] * sca, coordsv[1::3])
-    shi = req["zshift"]
-    coordsv[2::3] = np.where(shi != 0, coordsv[2::3] + shi, coordsv[2::3])
-    sca = req["zscale"]
-    coordsv[2::3] = np.where(sca != 1, coordsv[2::3] * sca, coordsv[2::3])
-
-    result["coordsv"] = coordsv.reshape((nncol, nnrow, 6)).astype(np.float64)
+    # coordsv is interleaved x, y, z; shift and scale all components in one
+    # pass over an (n, 3) view
+    shifts = np.array([req["xshift"], req["yshift"], req["zshift"]])
+    scales = np.array([req["xscale"], req["yscale"], req["zscale"]])
+    xyz = coordsv.reshape(-1, 3)
+    if np.any(shifts != 0):
+        xyz += shifts
+    if np.any(scales != 1):
+        xyz *= scales
+
+    result["coordsv"] = coordsv.reshape((nncol, nnrow, 6))
     result["zcornsv"] = zcornsv.reshape((nncol, nnrow, nnlay, 4)).astype(np.float32)
     result["actnumsv"] = actnumsv.reshape((ncol, nrow, nlay)).astype(np.int32)
     if "subgrids" in req:
@@ -77,51 +77,56 @@ def import_xtgcpgeom(
     """Using pure python for experimental grid geometry import."""
     #
     offset = 36
+    result = dict()
+    # header, arrays and metadata are read in sequence through one file handle
     with open(mfile.file, "rb") as fhandle:
         buf = fhandle.read(offset)
 
-    # unpack header
-    swap, magic, nformat, ncol, nrow, nlay = unpack("= i i i q q q", buf)
-    nncol = ncol + 1
-    nnrow = nrow + 1
-    nnlay = nlay + 1
-
-    if swap != 1 or magic != 1301:
-        raise ValueError(f"Error, swap magic are {swap} {magic}, expected is 1 1301")
+        # unpack header
+        swap, magic, nformat, ncol, nrow, nlay = unpack("= i i i q q q", buf)
+        nncol = ncol + 1
+        nnrow = nrow + 1
+        nnlay = nlay + 1
 
-    # subformat processing, indicating number of bytes per datatype
-    # here, 844 is native XTGeo (float64, float32, int32)
-    if nformat not in (444, 844, 841, 881, 884):
-        raise ValueError(f"The subformat value {nformat} is not valid")
-
-    coordfmt, zcornfmt, actnumfmt = [int(nbyte) for nbyte in str(nformat)]
+        if swap != 1 or magic != 1301:
+            raise ValueError(
+                f"Error, swap magic are {swap} {magic}, expected is 1 1301"
+            )
 
-    dtype_coordsv = "float" + str(coordfmt * 8)
-    dtype_zcornsv = "float" + str(zcornfmt * 8)
-    dtype_actnumv = "int" + str(actnumfmt * 8)
+        # subformat processing, indicating number of bytes per datatype
+        # here, 844 is native XTGeo (float64, float32, int32)
+        if nformat not in (444, 844, 841, 881, 884):
+            raise ValueError(f"The subformat value {nformat} is not valid")
+
+        coordfmt, zcornfmt, actnumfmt = [int(nbyte) for nbyte in str(nformat)]
+
+        dtype_coordsv = "float" + str(coordfmt * 8)
+        dtype_zcornsv = "float" + str(zcornfmt * 8)
+        dtype_actnumv = "int" + str(actnumfmt * 8)
+
+        ncoord = nncol * nnrow * 6
+        nzcorn = nncol * nnrow * nnlay * 4
+        nactnum = ncol * nrow * nlay
+        # read numpy arrays from file, continuing from the current position
+        for key, dtype, count in (
+            ("coordsv", dtype_coordsv, ncoord),
+            ("zcornsv", dtype_zcornsv, nzcorn),
+            ("actnumsv", dtype_actnumv, nactnum),
+        ):
+            if mmap:
+                result[key] = xsys.npfromfile(
+                    mfile.file,
+                    dtype=dtype,
+                    count=count,
+                    offset=fhandle.tell(),
+                    mmap=True,
+                )
+                fhandle.seek(result[key].nbytes, io.SEEK_CUR)
+            else:
+                result[key] = np.fromfile(fhandle, dtype=dtype, count=count)
 
-    ncoord = nncol * nnrow * 6
-    nzcorn = nncol * nnrow * nnlay * 4
-    nactnum = ncol * nrow * nlay
-    result = dict()
-    # read numpy arrays from file
-    result["coordsv"] = xsys.npfromfile(
-        mfile.file, dtype=dtype_coordsv, count=ncoord, offset=offset, mmap=mmap
-    )
-    newoffset = offset + ncoord * coordfmt
-    result["zcornsv"] = xsys.npfromfile(
-        mfile.file, dtype=dtype_zcornsv, count=nzcorn, offset=newoffset, mmap=mmap
-    )
-    newoffset += nzcorn * zcornfmt
-    result["actnumsv"] = xsys.npfromfile(
-        mfile.file, dtype=dtype_actnumv, count=nactnum, offset=newoffset, mmap=mmap
-    )
-    newoffset += nactnum * actnumfmt
-
-    # read metadata which will be at position offet + nfloat*narr +13
-    pos = newoffset + 13
-    with open(mfile.file, "rb") as fhandle:
-        fhandle.seek(pos)
+        # read metadata which will be at position offet + nfloat*narr +13
+        fhandle.seek(13, io.SEEK_CUR)
         jmeta = fhandle.read().decode()
 
     meta = json.loads(jmeta, object_pairs_hook=OrderedDict)
@@ -85,16 +85,13 @@ def refine_vertically(
     logger.debug("New layers: %s", newnlay)
 
     # refinefactors is an array with length nlay; has N refinements per single K layer
-    refinefactors = _cxtgeo.new_intarray(self.nlay)
-
     totvector = []
 
     for (_, rfi), (_, arr) in zip(rfactord.items(), self.subgrids.items()):
         for _ in range(len(arr)):
             totvector.append(rfi)
 
-    for inn, rfi in enumerate(totvector):
-        _cxtgeo.intarray_setitem(refinefactors, inn, rfi)
+    refinefactors = np.array(totvector, dtype=np.int32)
 
     ref_zcornsv = np.zeros(self.ncol * self.nrow * (newnlay + 1) * 4, dtype=np.float64)
     ref_actnumsv = np.zeros(self.ncol * self.nrow * newnlay, dtype=np.int32)
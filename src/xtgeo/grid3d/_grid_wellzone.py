@@ -55,7 +55,8 @@ def report_zone_mismatch(
 
     # get the IJK along the well as logs; use a copy of the well instance
     wll = well.copy()
-    wll.dataframe[zonelogname] += zonelogshift
+    if zonelogshift:
+        wll.dataframe[zonelogname] += zonelogshift
 
     if depthrange:
         d1, d2 = depthrange
@@ -87,26 +88,35 @@ def report_zone_mismatch(
 
     skiprange = list(range(zmin, z1)) + list(range(z2 + 1, zmax + 1))
 
+    # all filtering is done on numpy copies of the two zone columns; the dataframe
+    # itself is only subset once, at the end
+    if perflogname and perflogname not in df.columns:
+        return None
+    if filterlogname and filterlogname not in df.columns:
+        return None
+
+    perfmask = filtermask = None
+    if perflogname:
+        perf = np.nan_to_num(df[perflogname].to_numpy(dtype=np.float64), nan=-1)
+        pfr1, pfr2 = perflogrange
+        perfmask = (perf < pfr1) | (perf > pfr2)
+    if filterlogname:
+        filt = np.nan_to_num(df[filterlogname].to_numpy(dtype=np.float64), nan=-1)
+        ffr1, ffr2 = filterlogrange
+        filtermask = (filt < ffr1) | (filt > ffr2)
+
+    zvalues = []
     for zname in (zonelogname, zmodel):
-        if skiprange:  # needed check; du to a bug in pandas version 0.21 .. 0.23
-            df[zname].replace(skiprange, -888, inplace=True)
-        df[zname].fillna(-999, inplace=True)
-        if perflogname:
-            if perflogname in df.columns:
-                df[perflogname].replace(np.nan, -1, inplace=True)
-                pfr1, pfr2 = perflogrange
-                df[zname] = np.where(df[perflogname] < pfr1, -899, df[zname])
-                df[zname] = np.where(df[perflogname] > pfr2, -899, df[zname])
-            else:
-                return None
-        if filterlogname:
-            if filterlogname in df.columns:
-                df[filterlogname].replace(np.nan, -1, inplace=True)
-                ffr1, ffr2 = filterlogrange
-                df[zname] = np.where(df[filterlogname] < ffr1, -919, df[zname])
-                df[zname] = np.where(df[filterlogname] > ffr2, -919, df[zname])
-            else:
-                return None
+        zval = df[zname].to_numpy(dtype=np.float64)
+        if skiprange:
+            zval[np.isin(zval, skiprange)] = -888
+        zval[np.isnan(zval)] = -999
+        if perfmask is not None:
+            zval[perfmask] = -899
+        if filtermask is not None:
+            zval[filtermask] = -919
+        zvalues.append(zval)
+    zlog, zmod = zvalues
 
     # now there are various variotions on how to count mismatch:
     # dfuse 1: count matches when zonelogname is valid (exclude -888)
@@ -114,37 +124,28 @@ def report_zone_mismatch(
     # or -999)
     # The first one is the original approach
 
-    dfuse1 = df.copy(deep=True)
-    dfuse1 = dfuse1.loc[dfuse1[zonelogname] > -888]
+    zmatch = np.where(zmod == zlog, 1, 0)
 
-    dfuse1["zmatch1"] = np.where(dfuse1[zmodel] == dfuse1[zonelogname], 1, 0)
-    mcount1 = dfuse1["zmatch1"].sum()
-    tcount1 = dfuse1["zmatch1"].count()
-    if not np.isnan(mcount1):
-        mcount1 = int(mcount1)
-    if not np.isnan(tcount1):
-        tcount1 = int(tcount1)
+    use1 = zlog > -888
+    mcount1 = int(zmatch[use1].sum())
+    tcount1 = int(use1.sum())
+    res1 = mcount1 / tcount1 * 100 if tcount1 else np.nan
 
-    res1 = dfuse1["zmatch1"].mean() * 100
+    use2 = (zmod > -888) | (zlog > -888)
+    mcount2 = int(zmatch[use2].sum())
+    tcount2 = int(use2.sum())
+    res2 = mcount2 / tcount2 * 100 if tcount2 else np.nan
 
-    dfuse2 = df.copy(deep=True)
-    dfuse2 = dfuse2.loc[(df[zmodel] > -888) | (df[zonelogname] > -888)]
-    dfuse2["zmatch2"] = np.where(dfuse2[zmodel] == dfuse2[zonelogname], 1, 0)
-    mcount2 = dfuse2["zmatch2"].sum()
-    tcount2 = dfuse2["zmatch2"].count()
-    if not np.isnan(mcount2):
-        mcount2 = int(mcount2)
-    if not np.isnan(tcount2):
-        tcount2 = int(tcount2)
-
-    res2 = dfuse2["zmatch2"].mean() * 100
+    if resultformat == 1:
+        return (res1, mcount1, tcount1)
 
     # update Well() copy (segment only)
+    dfuse2 = df.loc[use2]
+    dfuse2 = dfuse2.assign(
+        **{zonelogname: zlog[use2], zmodel: zmod[use2], "zmatch2": zmatch[use2]}
+    )
     wll.dataframe = dfuse2
 
-    if resultformat == 1:
-        return (res1, mcount1, tcount1)
-
     res = {
         "MATCH1": res1,
         "MCOUNT1": mcount1,
@@ -84,8 +84,9 @@ def read_grdecl_3d_property(filename, keyword, dimensions, dtype=float):
                 f"Cannot import {keyword}, not present in file {filename}?"
             ) from si
 
-    # The values are stored in F order in the grdecl file
-    f_order_values = np.array([dtype(v) for v in result])
+    # The values are stored in F order in the grdecl file, numpy converts the
+    # value strings in one call
+    f_order_values = np.array(result, dtype=dtype)
     return np.ascontiguousarray(f_order_values.reshape(dimensions, order="F"))
 
 
@@ -23,8 +23,14 @@ def import_roff(pfile, name=None, grid=None):
         )
         name = None
 
-    result = dict()
     roff_param = RoffParameter.from_file(pfile._file, name)
+    return roff_parameter_to_kwargs(roff_param, grid=grid)
+
+
+def roff_parameter_to_kwargs(roff_param, grid=None):
+    """Convert a RoffParameter to GridProperty keyword arguments"""
+
+    result = dict()
     result["codes"] = roff_param.xtgeo_codes()
     result["name"] = roff_param.name
     result["ncol"] = int(roff_param.nx)
@@ -130,7 +130,7 @@ def operation_polygons(
             1,
         )
         if ier == -9:
-            logger.warning(f"Polygon no {id_ + 1} is not closed")
+            logger.warning("Polygon no %s is not closed", id_ + 1)
 
     gl.update_values_from_carray(proxy, cvals, np.float64, delete=True)
 
@@ -231,10 +231,11 @@ def import_ecl_restart_gridproperties(
                 usenamedatepairs.append((name, date))
 
     # Do the actual import
+    validpairs = set(validnamedatepairs)
     for namedate in usenamedatepairs:
         name, date = namedate
 
-        if name not in ("SGAS", "SOIL", "SWAT") and namedate not in validnamedatepairs:
+        if name not in ("SGAS", "SOIL", "SWAT") and namedate not in validpairs:
             # saturation keywords are a mess in Eclipse and friends; check later
             if strictkeycomb:
                 raise ValueError(
@@ -269,21 +270,18 @@ def import_ecl_restart_gridproperties(
 
 def _process_valid_namesdates(kwlist, grid):
     """Return lists with valid pairs, dates scanned from RESTART"""
-    validnamedatepairs = list()
-    validdates = list()
+    # dicts are used as ordered sets, as a restart file may have many thousand
+    # keyword and date combinations
+    validnamedatepairs = dict()
+    validdates = dict()
     valid_lengths = valid_gridprop_lengths(grid)
-    for kw in list(kwlist.itertuples(index=False, name=None)):
+    for kw in kwlist.itertuples(index=False, name=None):
         kwname, kwtyp, nlen, _, date = kw
-        if (
-            kwtyp != "CHAR"
-            and nlen in valid_lengths
-            and (kwname, date) not in validnamedatepairs
-        ):
-            validnamedatepairs.append((kwname, date))
-        if kwtyp != "CHAR" and nlen in valid_lengths and date not in validdates:
-            validdates.append(date)
-
-    return validnamedatepairs, validdates
+        if kwtyp != "CHAR" and nlen in valid_lengths:
+            validnamedatepairs[(kwname, date)] = None
+            validdates[date] = None
+
+    return list(validnamedatepairs), list(validdates)
 
 
 def _process_sloppydates(dates, validdates):
@@ -3,11 +3,12 @@ from __future__ import annotations
 import io
 from typing import TYPE_CHECKING, Literal
 
-import roffio
-
 import xtgeo
 from xtgeo.common import null_logger
 
+from ._gridprop_import_roff import roff_parameter_to_kwargs
+from ._roff_parameter import RoffParameter
+
 if TYPE_CHECKING:
     from xtgeo.common.sys import _XTGeoFile
 
@@ -37,24 +38,20 @@ def import_roff_gridproperties(
         List of GridProperty objects fetched from the ROFF file.
 
     """
-    validnames = set()
-    with roffio.lazy_read(pfile.file) as contents:
-        for tagname, tagkeys in contents:
-            for keyname, values in tagkeys:
-                if tagname == "parameter" and keyname == "name":
-                    validnames.add(values)
+    # read all requested parameters in a single pass over the file, instead of
+    # one scan for names and then one full read per parameter
+    parameters = RoffParameter.all_from_file(
+        pfile.file, names=None if names == "all" else set(names)
+    )
 
     # Rewind if this file is in memory
     if isinstance(pfile.file, (io.BytesIO, io.StringIO)):
         pfile.file.seek(0)
 
-    usenames = set()
-    if names == "all":
-        usenames = validnames
-    else:
+    if names != "all":
+        validnames = set(parameters)
         for name in names:
             if name in validnames:
-                usenames.add(name)
                 continue
 
             if strict:
@@ -68,8 +65,8 @@ def import_roff_gridproperties(
                 name,
             )
 
-    props = [
-        xtgeo.gridproperty_from_file(pfile.file, fformat="roff", name=name)
-        for name in usenames
+    return [
+        xtgeo.GridProperty(**roff_parameter_to_kwargs(param), filesrc=pfile.file)
+        for param in parameters.values()
+        if param is not None
     ]
-    return props
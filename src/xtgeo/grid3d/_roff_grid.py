@@ -229,9 +229,11 @@ class RoffGrid:
         scale = (self.xscale, self.yscale, self.zscale)
         coordsv = self.corner_lines.reshape((self.nx + 1, self.ny + 1, 2, 3))
         coordsv = np.flip(coordsv, -2)
-        coordsv = coordsv + offset
+        # adding the float64 offset upcasts to a new array, so the scaling can
+        # be done in place and no further copy is needed
+        coordsv = np.add(coordsv, offset, dtype=np.float64)
         coordsv *= scale
-        return coordsv.reshape((self.nx + 1, self.ny + 1, 6)).astype(np.float64)
+        return coordsv.reshape((self.nx + 1, self.ny + 1, 6))
 
     def xtgeo_actnum(self) -> np.ndarray:
         """
@@ -11,6 +11,8 @@ import roffio
 from xtgeo.common.constants import UNDEF_INT_LIMIT, UNDEF_LIMIT
 
 if TYPE_CHECKING:
+    from collections.abc import Container
+
     from xtgeo.common.types import FileLike
 
     from .grid_property import GridProperty
@@ -301,3 +303,82 @@ class RoffParameter:
             code_names=roff.get("code_names", None),
             code_values=roff.get("code_values", None),
         )
+
+    @staticmethod
+    def all_from_file(
+        filelike: FileLike, names: Container[str] | None = None
+    ) -> dict[str, RoffParameter | None]:
+        """
+        Read several RoffParameters from a roff file in one pass.
+
+        Args:
+            filelike (str or byte stream): The file to read from.
+            names (container of str or None): The names of the parameters to
+                read. If names=None, all parameters are read.
+        Returns:
+            Dictionary with the names of all parameters in the file, in file
+            order, as keys. The values are the RoffParameter for the requested
+            names and None for the parameters that were skipped. If a name
+            occurs more than once, the first parameter with that name is used.
+        """
+        dimensions: dict[str, int] = {}
+        filetype = None
+        found: dict[str, dict[str, Any] | None] = {}
+        with roffio.lazy_read(filelike) as tag_generator:
+            for tag, keys in tag_generator:
+                if tag == "filedata":
+                    for key in keys:
+                        if key[0] == "filetype":
+                            filetype = key[1]
+                elif tag == "dimensions":
+                    for key in keys:
+                        if key[0] in ("nX", "nY", "nZ"):
+                            dimensions[key[0]] = key[1]
+                elif tag == "parameter":
+                    # As in from_file(), keys fetch their value when indexed, so
+                    # the data of skipped parameters is never read
+                    param: dict[str, Any] | None = None
+                    for key in keys:
+                        if key[0] == "name":
+                            pname = key[1]
+                            if pname in found or (
+                                names is not None and pname not in names
+                            ):
+                                found.setdefault(pname, None)
+                                break
+                            param = found[pname] = {}
+                        elif param is not None and key[0] in (
+                            "data",
+                            "codeValues",
+                            "codeNames",
+                        ):
+                            param[key[0]] = key[1]
+
+        if filetype not in ["grid", "parameter"]:
+            raise ValueError(
+                f"File {filelike} did not"
+                f" have filetype parameter or grid, found {filetype}"
+            )
+
+        result: dict[str, RoffParameter | None] = {}
+        for pname, param in found.items():
+            if param is None:
+                result[pname] = None
+                continue
+            for key_name in ("nX", "nY", "nZ"):
+                if key_name not in dimensions:
+                    raise ValueError(
+                        f"Missing non-optional keyword dimensions:{key_name}"
+                    )
+            if "data" not in param:
+                raise ValueError("Missing non-optional keyword parameter:data")
+            result[pname] = RoffParameter(
+                nx=dimensions["nX"],
+                ny=dimensions["nY"],
+                nz=dimensions["nZ"],
+                name=pname,
+                values=param["data"],
+                code_names=param.get("codeNames", None),
+                code_values=param.get("codeValues", None),
+            )
+        return result
@@ -39,6 +39,7 @@ xtg = xtgeo.common.XTGeoDialog()
 logger = null_logger(__name__)
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     import pandas as pd
 
     from xtgeo import Polygons, Well
@@ -70,6 +71,36 @@ METRIC = Literal[
 # --------------------------------------------------------------------------------------
 
 
+# Grid.to_file() formats, including aliases, as (exporter, extra arguments)
+_EXPORTERS: dict[str, tuple[Callable, tuple]] = {
+    **dict.fromkeys(
+        ("roff", "roff_binary", "roff_bin", "roffbin"),
+        (_grid_export.export_roff, ("binary",)),
+    ),
+    **dict.fromkeys(
+        ("roff_ascii", "roff_asc", "roffasc"),
+        (_grid_export.export_roff, ("ascii",)),
+    ),
+    "grdecl": (_grid_export.export_grdecl, (1,)),
+    "bgrdecl": (_grid_export.export_grdecl, (0,)),
+    "egrid": (_grid_export.export_egrid, ()),
+    "fegrid": (_grid_export.export_fegrid, ()),
+}
+
+
+def _flat_indices(values: np.ndarray, compact: bool = False) -> np.ndarray:
+    """Flat indices of nonzero values.
+
+    With compact, the indices are int32 when they all fit, which halves the
+    memory of the index array for all but huge grids. This is for internal
+    use; the public index methods keep the numpy default intp dtype.
+    """
+    indices = np.flatnonzero(values)
+    if compact and values.size <= np.iinfo(np.int32).max:
+        return indices.astype(np.int32)
+    return indices
+
+
 # METHODS as wrappers to class init + import
 def _handle_import(
     grid_constructor: Callable[..., Grid],
@@ -90,6 +121,7 @@ def _handle_import(
     """
     gfile = xtgeo._XTGeoFile(gfile, mode="rb")
     if fformat == "eclipserun":
+        _grid_import_ecl.prefetch_ecl_run(gfile.name, **kwargs)
         ecl_grid = grid_constructor(
             **_grid_import.from_file(
                 xtgeo._XTGeoFile(gfile.name + ".EGRID", mode="rb"), fformat="egrid"
@@ -375,6 +407,26 @@ class Grid(_Grid3D):
 
     """
 
+    __slots__ = (
+        "_xtgformat",
+        "_coordsv",
+        "_zcornsv",
+        "_actnumsv",
+        "_dualporo",
+        "_dualperm",
+        "_dualactnum",
+        "_filesrc",
+        "_props",
+        "_name",
+        "_subgrids",
+        "_ijk_handedness",
+        "_metadata",
+        "_roxgrid",
+        "_roxindexer",
+        "units",
+        "_tmp",
+    )
+
     # pylint: disable=too-many-public-methods
     @allow_deprecated_init
     def __init__(
@@ -392,9 +444,11 @@ class Grid(_Grid3D):
         roxgrid: Any | None = None,
         roxindexer: Any | None = None,
     ):
-        coordsv = np.asarray(coordsv)
-        zcornsv = np.asarray(zcornsv)
-        actnumsv = np.asarray(actnumsv)
+        # the C routines loop over i, j, k with k innermost and take the arrays
+        # as flat buffers, so keep them C ordered (no copy if they already are)
+        coordsv = np.ascontiguousarray(coordsv)
+        zcornsv = np.ascontiguousarray(zcornsv)
+        actnumsv = np.ascontiguousarray(actnumsv)
         if coordsv.dtype != np.float64:
             raise TypeError(
                 f"The dtype of the coordsv array must be float64, got {coordsv.dtype}"
@@ -651,7 +705,7 @@ class Grid(_Grid3D):
     @property
     def nactive(self) -> int:
         """int: Returns the number of active cells (read only)."""
-        return len(self.actnum_indices)
+        return int(np.count_nonzero(self._actnum_values()))
 
     @property
     def actnum_array(self) -> np.ndarray:
@@ -672,14 +726,12 @@ class Grid(_Grid3D):
         In dual poro/perm systems, this will be the active indices for the
         matrix cells and/or fracture cells (i.e. actnum >= 1).
         """
-        actnumv = self.get_actnum()
-        actnumv = np.ravel(actnumv.values)
-        return np.flatnonzero(actnumv)
+        return _flat_indices(self._actnum_values())
 
     @property
     def ntotal(self) -> int:
         """Returns the total number of cells (read only)."""
-        return self.ncol * self.nrow * self.nlay
+        return self._ncol * self._nrow * self._nlay
 
     @property
     def dualporo(self) -> bool:
@@ -736,8 +788,9 @@ class Grid(_Grid3D):
         if not isinstance(plist, list):
             raise ValueError("Input to props must be a list")
 
+        dimensions = self.dimensions
         for gridprop in plist:
-            if gridprop.dimensions != self.dimensions:
+            if gridprop.dimensions != dimensions:
                 raise IndexError(
                     f"Property NX NY NZ <{gridprop.name}> does not match grid!"
                 )
@@ -848,32 +901,13 @@ class Grid(_Grid3D):
         if not _gfile.memstream:
             _gfile.check_folder(raiseerror=OSError)
 
-        valid_formats = {
-            "roff": ["roff", "roff_binary", "roff_bin", "roffbin"],
-            "roff_ascii": ["roff_ascii", "roff_asc", "roffasc"],
-            "grdecl": ["grdecl"],
-            "bgrdecl": ["bgrdecl"],
-            "egrid": ["egrid"],
-            "fegrid": ["fegrid"],
-        }
-
-        if fformat in valid_formats["roff"]:
-            _grid_export.export_roff(self, _gfile.name, "binary")
-        elif fformat in valid_formats["roff_ascii"]:
-            _grid_export.export_roff(self, _gfile.name, "ascii")
-        elif fformat in valid_formats["grdecl"]:
-            _grid_export.export_grdecl(self, _gfile.name, 1)
-        elif fformat in valid_formats["bgrdecl"]:
-            _grid_export.export_grdecl(self, _gfile.name, 0)
-        elif fformat in valid_formats["egrid"]:
-            _grid_export.export_egrid(self, _gfile.name)
-        elif fformat in valid_formats["fegrid"]:
-            _grid_export.export_fegrid(self, _gfile.name)
-        else:
+        if fformat not in _EXPORTERS:
             raise ValueError(
                 f"Invalid file format: {fformat}, valid options are: "
-                f"{', '.join(v for vv in valid_formats.values() for v in vv)}"
+                f"{', '.join(_EXPORTERS)}"
             )
+        exporter, args = _EXPORTERS[fformat]
+        exporter(self, _gfile.name, *args)
 
     def to_hdf(
         self,
@@ -1567,13 +1601,18 @@ class Grid(_Grid3D):
 
         .. versionchanged:: 2.18 Added inverse option
         """
-        actnumv = self.get_actnum().values.copy(order=order)
-        actnumv = np.ravel(actnumv, order=order)
+        return self._get_actnum_indices(order=order, inverse=inverse)
+
+    def _get_actnum_indices(
+        self,
+        order: Literal["C", "F", "A", "K"] = "C",
+        inverse: bool = False,
+        compact: bool = False,
+    ) -> np.ndarray:
+        actnumv = np.ravel(self._actnum_values(), order=order)
         if inverse:
-            actnumv -= 1
-            return np.flatnonzero(actnumv)
-        else:
-            return np.flatnonzero(actnumv)
+            return _flat_indices(actnumv != 1, compact=compact)
+        return _flat_indices(actnumv, compact=compact)
 
     def get_dualactnum_indices(
         self,
@@ -1586,6 +1625,14 @@ class Grid(_Grid3D):
             order (str): "Either 'C' (default) or 'F' order).
             fracture (bool): If True use Fracture properties.
         """
+        return self._get_dualactnum_indices(order=order, fracture=fracture)
+
+    def _get_dualactnum_indices(
+        self,
+        order: Literal["C", "F", "A", "K"] = "C",
+        fracture: bool = False,
+        compact: bool = False,
+    ) -> np.ndarray | None:
         if not self._dualporo:
             return None
 
@@ -1597,12 +1644,12 @@ class Grid(_Grid3D):
             actnumvf = actnumv.copy()
             actnumvf[(actnumv == 3) | (actnumv == 2)] = 1
             actnumvf[(actnumv == 1) | (actnumv == 0)] = 0
-            return np.flatnonzero(actnumvf)
+            return _flat_indices(actnumvf, compact=compact)
 
         actnumvm = actnumv.copy()
         actnumvm[(actnumv == 3) | (actnumv == 1)] = 1
         actnumvm[(actnumv == 2) | (actnumv == 0)] = 0
-        return np.flatnonzero(actnumvm)
+        return _flat_indices(actnumvm, compact=compact)
 
     @deprecation.deprecated(
         deprecated_in="2.16",
@@ -1626,11 +1673,7 @@ class Grid(_Grid3D):
                 "property objects (self.props is None)"
             )
 
-        for obj in self.props:
-            if obj.name == name:
-                return obj
-
-        return None
+        return self._props.get_prop_by_name(name, raiseserror=False)
 
     def get_actnum(
         self,
@@ -1669,23 +1712,22 @@ class Grid(_Grid3D):
         if dual and self._dualactnum:
             act = self._dualactnum.copy()
         else:
+            if self._xtgformat == 1:
+                values = _gridprop_lowlevel.f2c_order(self, self._actnumsv)
+            else:
+                values = self._actnumsv.copy()
+
+            # the values are masked for undef when set, no need to start from
+            # a zero array or to mask again afterwards
             act = xtgeo.grid3d.GridProperty(
                 ncol=self._ncol,
                 nrow=self._nrow,
                 nlay=self._nlay,
-                values=np.zeros((self._ncol, self._nrow, self._nlay), dtype=np.int32),
+                values=values,
                 name=name,
                 discrete=True,
             )
 
-            if self._xtgformat == 1:
-                values = _gridprop_lowlevel.f2c_order(self, self._actnumsv)
-            else:
-                values = self._actnumsv
-
-            act.values = values
-            act.mask_undef()
-
         if asmasked:
             act.values = ma.masked_equal(act.values, 0)
 
@@ -1723,6 +1765,7 @@ class Grid(_Grid3D):
         asmasked: bool = True,
         mask: bool | None = None,
         metric: METRIC = "z projection",
+        dtype: type[np.float64] | type[np.float32] = np.float64,
     ) -> GridProperty:
         """Return the dZ as GridProperty object.
 
@@ -1744,6 +1787,7 @@ class Grid(_Grid3D):
                 * "x projection": dx
                 * "y projection": dy
                 * "z projection": dz
+            dtype: Values dtype, np.float64 (default) or np.float32.
 
         Returns:
             A XTGeo GridProperty object dZ
@@ -1761,6 +1805,7 @@ class Grid(_Grid3D):
             flip=flip,
             asmasked=asmasked,
             metric=metric,
+            dtype=dtype,
         )
 
     def get_dx(
@@ -1768,6 +1813,7 @@ class Grid(_Grid3D):
         name: str = "dX",
         asmasked: bool = True,
         metric: METRIC = "horizontal",
+        dtype: type[np.float64] | type[np.float32] = np.float64,
     ) -> GridProperty:
         """Return the dX as GridProperty object.
 
@@ -1787,17 +1833,21 @@ class Grid(_Grid3D):
                 * "x projection": dx
                 * "y projection": dy
                 * "z projection": dz
+            dtype: Values dtype, np.float64 (default) or np.float32.
 
         Returns:
             XTGeo GridProperty objects containing dx.
         """
-        return _grid_etc1.get_dx(self, name=name, asmasked=asmasked, metric=metric)
+        return _grid_etc1.get_dx(
+            self, name=name, asmasked=asmasked, metric=metric, dtype=dtype
+        )
 
     def get_dy(
         self,
         name: str = "dY",
         asmasked: bool = True,
         metric: METRIC = "horizontal",
+        dtype: type[np.float64] | type[np.float32] = np.float64,
     ) -> GridProperty:
         """Return the dY as GridProperty object.
 
@@ -1817,11 +1867,14 @@ class Grid(_Grid3D):
                 * "x projection": dx
                 * "y projection": dy
                 * "z projection": dz
+            dtype: Values dtype, np.float64 (default) or np.float32.
 
         Returns:
             Two XTGeo GridProperty objects (dx, dy).
         """
-        return _grid_etc1.get_dy(self, name=name, asmasked=asmasked, metric=metric)
+        return _grid_etc1.get_dy(
+            self, name=name, asmasked=asmasked, metric=metric, dtype=dtype
+        )
 
     @deprecation.deprecated(
         deprecated_in="3.0",
@@ -2009,6 +2062,7 @@ class Grid(_Grid3D):
         names: tuple[str, str, str] = ("X_UTME", "Y_UTMN", "Z_TVDSS"),
         asmasked: bool = True,
         mask: bool | None = None,
+        dtype: type[np.float64] | type[np.float32] = np.float64,
     ) -> tuple[GridProperty, GridProperty, GridProperty,]:
         """Returns 3 xtgeo.grid3d.GridProperty objects for x, y, z coordinates.
 
@@ -2022,6 +2076,7 @@ class Grid(_Grid3D):
             Y_UTMN, Z_TVDSS).
             asmasked: If True, then inactive cells is masked (numpy.ma).
             mask (bool): Deprecated, use asmasked instead!
+            dtype: Values dtype, np.float64 (default) or np.float32.
         """
         if mask is not None:
             xtg.warndeprecated(
@@ -2030,7 +2085,7 @@ class Grid(_Grid3D):
             )
             asmasked = self._evaluate_mask(mask)
 
-        return _grid_etc1.get_xyz(self, names=names, asmasked=asmasked)
+        return _grid_etc1.get_xyz(self, names=names, asmasked=asmasked, dtype=dtype)
 
     def get_xyz_cell_corners(
         self,
@@ -2070,14 +2125,45 @@ class Grid(_Grid3D):
             (458704.10..., 1716.969970703125)
 
         Raises:
-            RuntimeWarning if spesification is invalid.
+            ValueError if ijk is not integers or the cell is outside the grid.
         """
         return _grid_etc1.get_xyz_cell_corners(
             self, ijk=ijk, activeonly=activeonly, zerobased=zerobased
         )
 
+    def get_xyz_cell_corners_batch(
+        self,
+        ijk: npt.ArrayLike,
+        activeonly: bool = True,
+        zerobased: bool = False,
+    ) -> np.ndarray:
+        """Return x, y, z for each corner of many cells, in one call.
+
+        This is much faster than calling :meth:`get_xyz_cell_corners` in a loop.
+
+        Args:
+            ijk: Array-like with shape (M, 3) of I J K per cell (NB! cell counting
+                starts from 1 unless zerobased is True)
+            activeonly (bool): Give NaN for inactive cells if set to True.
+            zerobased (bool): If True, cell counting starts from 0.
+
+        Returns:
+            A numpy array with shape (M, 24), where each row has the corners
+            (x1, y1, z1, ... x8, y8, z8) of a cell, in the same order as
+            :meth:`get_xyz_cell_corners`.
+
+        Raises:
+            ValueError if ijk is not integers, has the wrong shape or is outside
+                the grid.
+        """
+        return _grid_etc1.get_xyz_cell_corners_batch(
+            self, ijk, activeonly=activeonly, zerobased=zerobased
+        )
+
     def get_xyz_corners(
-        self, names: tuple[str, str, str] = ("X_UTME", "Y_UTMN", "Z_TVDSS")
+        self,
+        names: tuple[str, str, str] = ("X_UTME", "Y_UTMN", "Z_TVDSS"),
+        dtype: type[np.float64] | type[np.float32] = np.float64,
     ) -> tuple[GridProperty, ...]:
         """Returns 8*3 (24) xtgeo.grid3d.GridProperty objects, x, y, z for each corner.
 
@@ -2102,6 +2188,9 @@ class Grid(_Grid3D):
         Args:
             names (list): Generic name of the properties, will have a
                 number added, e.g. X0, X1, etc.
+            dtype: Values dtype, np.float64 (default) or np.float32. Corners are
+                computed in double precision either way, but np.float32 halves
+                the memory held by the 24 returned properties.
 
         Example::
 
@@ -2118,7 +2207,7 @@ class Grid(_Grid3D):
             RunetimeError if corners has wrong spesification
         """
         # return the 24 objects in a long tuple (x1, y1, z1, ... x8, y8, z8)
-        return _grid_etc1.get_xyz_corners(self, names=names)
+        return _grid_etc1.get_xyz_corners(self, names=names, dtype=dtype)
 
     def get_layer_slice(
         self, layer: int, top: bool = True, activeonly: bool = True
@@ -2754,3 +2843,12 @@ class Grid(_Grid3D):
     def _xtgformat2(self) -> None:
         """Shortform... arrays from old structure xtgformat=1 to new xtgformat=2."""
         self._convert_xtgformat1to2()
+
+    def _actnum_values(self) -> np.ndarray:
+        """Actnum values as a 3D array in C order, without an ACTNUM GridProperty.
+
+        For xtgformat=2 this is the internal array itself, do not modify it.
+        """
+        if self._xtgformat == 1:
+            return self.get_actnum().values
+        return self._actnumsv
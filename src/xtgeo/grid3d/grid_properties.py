@@ -1,9 +1,10 @@
 """Module for Grid Properties."""
 from __future__ import annotations
 
-import hashlib
+import struct
 import warnings
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, List, Literal, Tuple, Union
 
 import deprecation
@@ -13,6 +14,7 @@ import pandas as pd
 import xtgeo
 from xtgeo.common import XTGDescription, XTGeoDialog, null_logger
 from xtgeo.common.constants import MAXDATES, MAXKEYWORDS
+from xtgeo.common.sys import _new_hash
 from xtgeo.common.version import __version__
 
 from . import _grid3d_utils as utils
@@ -36,7 +38,7 @@ GridPropertiesKeywords = Union[
 
 
 def gridproperties_from_file(
-    pfile: _XTGeoFile,
+    pfile: FileLike | _XTGeoFile,
     fformat: str | None = None,
     names: list[str] | None = None,
     dates: list[str] | None = None,
@@ -74,7 +76,8 @@ def gridproperties_from_file(
         ...     grid=grd,
         ... )
     """
-    pfile = xtgeo._XTGeoFile(pfile, mode="rb")
+    if not isinstance(pfile, xtgeo._XTGeoFile):
+        pfile = xtgeo._XTGeoFile(pfile, mode="rb")
 
     pfile.check_file(raiseerror=ValueError)
 
@@ -82,14 +85,15 @@ def gridproperties_from_file(
         _fformat: str = pfile.detect_fformat()
     else:
         _fformat = pfile.generic_format_by_proposal(fformat)  # default
+    _fformat = _fformat.lower()
 
-    if _fformat.lower() in ["roff_ascii", "roff_binary"]:
+    if _fformat in ("roff_ascii", "roff_binary"):
         props = _gridprops_import_roff.import_roff_gridproperties(
             pfile, names, strict=strict
         )
         return GridProperties(props=props)
 
-    elif _fformat.lower() == "init":
+    if _fformat == "init":
         return GridProperties(
             props=_gridprops_import_eclrun.import_ecl_init_gridproperties(
                 pfile,
@@ -99,7 +103,7 @@ def gridproperties_from_file(
                 maxkeys=MAXKEYWORDS,
             )
         )
-    elif _fformat.lower() == "unrst":
+    if _fformat == "unrst":
         return GridProperties(
             props=_gridprops_import_eclrun.import_ecl_restart_gridproperties(
                 pfile,
@@ -111,8 +115,8 @@ def gridproperties_from_file(
                 maxkeys=MAXKEYWORDS,
             )
         )
-    else:
-        raise ValueError("Invalid file format {_fformat}")
+
+    raise ValueError(f"Invalid file format {_fformat}")
 
 
 # --------------------------------------------------------------------------------------
@@ -151,7 +155,8 @@ def gridproperties_dataframe(
         ijk (bool): If True, show cell indices, IX JY KZ columns
         xyz (bool): If True, show cell center coordinates (needs grid).
         doubleformat (bool): If True, floats are 64 bit, otherwise 32 bit.
-            Note that coordinates (if xyz=True) is always 64 bit floats.
+            Note that coordinates (if xyz=True) is always 64 bit floats,
+            while ACTNUM is 8 bit and IX, JY, KZ are 32 bit integers.
         grid (Grid): The grid geometry object. This is required for the
             xyz option.
     Returns:
@@ -172,19 +177,28 @@ def gridproperties_dataframe(
 
     proplist = list(gridproperties)
 
+    # find the active cells once, and use that to pick the values of all
+    # columns, instead of compressing each column by its own mask
+    active = None
+    if activeonly:
+        if grid:
+            active = np.ma.getdata(grid.get_actnum().values1d) != 0
+        elif proplist:
+            active = ~np.ma.getmaskarray(proplist[0].values1d)
+
     dataframe_dict = dict()
     if ijk:
         if activeonly:
             if grid:
                 ix, jy, kz = _grid_etc1.get_ijk(grid)
-                dataframe_dict["IX"] = ix.get_active_npvalues1d()
-                dataframe_dict["JY"] = jy.get_active_npvalues1d()
-                dataframe_dict["KZ"] = kz.get_active_npvalues1d()
+                dataframe_dict["IX"] = _active_values1d(ix, active)
+                dataframe_dict["JY"] = _active_values1d(jy, active)
+                dataframe_dict["KZ"] = _active_values1d(kz, active)
             elif proplist:
                 ix, jy, kz = _grid_etc1.get_ijk(proplist[0])
-                dataframe_dict["IX"] = ix.get_active_npvalues1d()
-                dataframe_dict["JY"] = jy.get_active_npvalues1d()
-                dataframe_dict["KZ"] = kz.get_active_npvalues1d()
+                dataframe_dict["IX"] = _active_values1d(ix, active)
+                dataframe_dict["JY"] = _active_values1d(jy, active)
+                dataframe_dict["KZ"] = _active_values1d(kz, active)
         else:
             if not grid:
                 raise ValueError(
@@ -192,7 +206,8 @@ def gridproperties_dataframe(
                 )
             act = grid.get_actnum(dual=True)
             ix, jy, kz = grid.get_ijk(asmasked=False)
-            dataframe_dict["ACTNUM"] = act.values1d
+            # actnum values are in range 0..3 (dual porosity), so 8 bit is enough
+            dataframe_dict["ACTNUM"] = act.values1d.astype(np.int8)
             dataframe_dict["IX"] = ix.values1d
             dataframe_dict["JY"] = jy.values1d
             dataframe_dict["KZ"] = kz.values1d
@@ -203,33 +218,39 @@ def gridproperties_dataframe(
 
         xc, yc, zc = grid.get_xyz(asmasked=activeonly)
         if activeonly:
-            dataframe_dict["X_UTME"] = xc.get_active_npvalues1d()
-            dataframe_dict["Y_UTMN"] = yc.get_active_npvalues1d()
-            dataframe_dict["Z_TVDSS"] = zc.get_active_npvalues1d()
+            dataframe_dict["X_UTME"] = _active_values1d(xc, active)
+            dataframe_dict["Y_UTMN"] = _active_values1d(yc, active)
+            dataframe_dict["Z_TVDSS"] = _active_values1d(zc, active)
         else:
             dataframe_dict["X_UTME"] = xc.values1d
             dataframe_dict["Y_UTMN"] = yc.values1d
             dataframe_dict["Z_TVDSS"] = zc.values1d
 
+    dtype = np.float64 if doubleformat else np.float32
     for prop in gridproperties:
         if activeonly:
-            vector = prop.get_active_npvalues1d()
+            # this is already a copy, so no need to copy again if dtype matches
+            vector = _active_values1d(prop, active).astype(dtype, copy=False)
         else:
-            vector = prop.values1d.copy()
-            # mask values not supported in Pandas:
-            if prop.isdiscrete:
-                vector = vector.filled(fill_value=0)
-            else:
-                vector = vector.filled(fill_value=np.nan)
-
-        if doubleformat:
-            vector = vector.astype(np.float64)
-        else:
-            vector = vector.astype(np.float32)
+            # one copy in the wanted dtype, then fill masked cells in place as
+            # mask values are not supported in Pandas
+            values = prop.values1d
+            vector = np.ma.getdata(values).astype(dtype)
+            np.copyto(
+                vector,
+                0 if prop.isdiscrete else np.nan,
+                where=np.ma.getmaskarray(values),
+            )
 
         dataframe_dict[prop.name] = vector
 
-    return pd.DataFrame.from_dict(dataframe_dict)
+    # let pandas adopt the column arrays as they are, instead of copying them
+    return pd.DataFrame(dataframe_dict, copy=False)
+
+
+def _active_values1d(prop: GridProperty, active: np.ndarray) -> np.ndarray:
+    """Return a 1D copy of the values of a property in the given active cells."""
+    return np.ma.getdata(prop.values1d)[active]
 
 
 class GridProperties(_Grid3D):
@@ -310,6 +331,9 @@ class GridProperties(_Grid3D):
         # deprecated
         self._names: list[str] = []
 
+        # index of props by name, see get_prop_by_name()
+        self._by_name: dict[str, GridProperty] = {}
+
         # This triggers the setter for 'props', ensuring proper
         # setup of related attributes like '_ncol', '_nrow',
         # '_nlay', and '_names', and performs a consistency check.
@@ -387,7 +411,8 @@ class GridProperties(_Grid3D):
         if len(nameslist) > len(set(nameslist)):
             raise ValueError("List of names contains duplicates; names must be unique")
 
-        self._names = nameslist
+        # keep a copy, so later changes to the input list do not leak in
+        self._names = list(nameslist)
 
     @property
     def props(self) -> list[GridProperty] | None:
@@ -421,6 +446,7 @@ class GridProperties(_Grid3D):
     @props.setter
     def props(self, propslist: list[GridProperty]) -> None:
         self._props = propslist
+        self._update_name_index()
         if propslist:
             self._ncol = propslist[0].ncol
             self._nrow = propslist[0].nrow
@@ -464,13 +490,17 @@ class GridProperties(_Grid3D):
 
     # Copy, and etc aka setters and getters
 
-    def copy(self) -> GridProperties:
+    def copy(self, deep: bool = True) -> GridProperties:
         """Copy a GridProperties instance to a new unique instance.
 
-        Note that the GridProperty instances will also be unique.
+        Args:
+            deep: If True (default), the GridProperty instances will also be
+                unique. If False, the new instance refers to the same
+                GridProperty instances, which avoids copying their values.
         """
 
-        gps = GridProperties(props=[p.copy() for p in self.props] if self.props else [])
+        props = [p.copy() for p in self._props] if deep else list(self._props)
+        gps = GridProperties(props=props)
         gps._names = self._names.copy()
         return gps
 
@@ -488,22 +518,40 @@ class GridProperties(_Grid3D):
             return None
         return dsc.astext()
 
-    def generate_hash(self) -> str:
+    def generate_hash(
+        self,
+        hashmethod: Literal["md5", "sha256", "blake2b"] | Callable = "sha256",
+    ) -> str:
         """str: Return a unique hash ID for current gridproperties instance.
 
+        The default sha256 is kept for backwards compatibility. When the hash
+        is only used to compare instances for equality, "blake2b" is faster.
+        See :meth:`~xtgeo.common.sys.generic_hash()` for the hash methods.
+
         .. versionadded:: 2.10
         """
-        mhash = hashlib.sha256()
 
-        hashinput = ""
-        for prop in self._props:
-            gid = (
-                f"{prop.ncol}{prop.nrow}{prop.nlay}{prop.values.mean()}"
-                f"{prop.values.min()}{prop.values.max()}"
-            )
-            hashinput += gid
+        def _hash_prop(prop: GridProperty) -> bytes:
+            # the dimensions and the raw bytes of the values, where masked
+            # cells are set to undef
+            phash = _new_hash(hashmethod)
+            phash.update(struct.pack("<III", prop.ncol, prop.nrow, prop.nlay))
+            values = np.ascontiguousarray(prop.values.filled(prop.undef))
+            phash.update(memoryview(values).cast("B"))
+            return phash.digest()
+
+        # hashlib releases the GIL while hashing large buffers, so the
+        # properties are hashed in threads and their digests combined
+        if len(self._props) > 1:
+            with ThreadPoolExecutor() as executor:
+                digests = list(executor.map(_hash_prop, self._props))
+        else:
+            digests = [_hash_prop(prop) for prop in self._props]
+
+        mhash = _new_hash(hashmethod)
+        for digest in digests:
+            mhash.update(digest)
 
-        mhash.update(hashinput.encode())
         return mhash.hexdigest()
 
     def get_prop_by_name(
@@ -517,11 +565,15 @@ class GridProperties(_Grid3D):
                 return None
 
         """
-        for prop in self._props:
-            logger.debug("Look for %s, actual is %s", name, prop.name)
-            if prop.name == name:
-                logger.debug(repr(prop))
-                return prop
+        prop = self._by_name.get(name)
+        if prop is None or prop.name != name:
+            # names of the properties may have been changed after indexing
+            self._update_name_index()
+            prop = self._by_name.get(name)
+
+        if prop is not None:
+            logger.debug("Found property %r", prop)
+            return prop
 
         if raiseserror:
             raise ValueError(f"Cannot find property with name <{name}>")
@@ -534,9 +586,12 @@ class GridProperties(_Grid3D):
             self._ncol = proplist[0].ncol
             self._nrow = proplist[0].nrow
             self._nlay = proplist[0].nlay
+        # the props already present have been checked, so only check the new ones
+        self._consistency_check(proplist)
         self._props += proplist
+        for prop in proplist:
+            self._by_name.setdefault(prop.name, prop)
         self._names = [p.name for p in self._props]
-        self._consistency_check()
 
     def get_ijk(
         self,
@@ -701,7 +756,8 @@ class GridProperties(_Grid3D):
             ijk (bool): If True, show cell indices, IX JY KZ columns
             xyz (bool): If True, show cell center coordinates (needs grid).
             doubleformat (bool): If True, floats are 64 bit, otherwise 32 bit.
-                Note that coordinates (if xyz=True) is always 64 bit floats.
+                Note that coordinates (if xyz=True) is always 64 bit floats,
+                while ACTNUM is 8 bit and IX, JY, KZ are 32 bit integers.
             grid (Grid): The grid geometry object. This is required for the
                 xyz option.
 
@@ -767,8 +823,14 @@ class GridProperties(_Grid3D):
 
         return self.get_dataframe(*args, **kwargs)
 
-    def _consistency_check(self) -> None:
-        for p in self._props:
+    def _update_name_index(self) -> None:
+        """Rebuild the name index, where the first property with a name wins."""
+        self._by_name = {}
+        for prop in self._props:
+            self._by_name.setdefault(prop.name, prop)
+
+    def _consistency_check(self, props: list[GridProperty] | None = None) -> None:
+        for p in self._props if props is None else props:
             if (p.ncol, p.nrow, p.nlay) != (self.ncol, self.nrow, self.nlay):
                 raise ValueError("Mismatching dimensions in GridProperties members.")
 
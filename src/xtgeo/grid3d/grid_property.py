@@ -4,6 +4,7 @@ import copy
 import functools
 import hashlib
 import pathlib
+import struct
 import warnings
 from collections.abc import Callable
 from types import FunctionType
@@ -606,7 +607,7 @@ class GridProperty(_Grid3D):
     @property
     def nactive(self) -> int:
         """Get the number of active cells."""
-        return len(self.actnum_indices)
+        return int(np.ma.count(self.values))
 
     @property
     def geometry(self) -> Grid | None:
@@ -819,12 +820,27 @@ class GridProperty(_Grid3D):
         .. versionadded:: 2.10
 
         """
+        # compress once instead of letting each masked reduction fill a copy
+        active = np.ma.compressed(self._values)
+        if active.size > 0:
+            mean, vmin, vmax = active.mean(), active.min(), active.max()
+        else:
+            mean = vmin = vmax = np.nan
+
         mhash = hashlib.sha256()
-        gid = (
-            f"{self._filesrc}{self._ncol}{self._nrow}{self._nlay}"
-            f"{self._values.mean()}{self._values.min()}{self._values.max()}"
+        mhash.update(str(self._filesrc).encode())
+        # fixed width binary input; avoids the lossy float to str round trip
+        mhash.update(
+            struct.pack(
+                "<IIIddd",
+                self._ncol,
+                self._nrow,
+                self._nlay,
+                float(mean),
+                float(vmin),
+                float(vmax),
+            )
         )
-        mhash.update(gid.encode())
         return mhash.hexdigest()
 
     @classmethod
@@ -1280,14 +1296,13 @@ class GridProperty(_Grid3D):
             ncol=self._ncol, nrow=self._nrow, nlay=self._nlay, name=name, discrete=True
         )
 
-        orig = self.values
-        vact = np.ma.ones(self.values.shape)
-        vact[orig.mask] = 0
+        # build the int32 array directly from the mask, with no float array between
+        vact = np.logical_not(np.ma.getmaskarray(self.values)).astype(np.int32)
 
         if asmasked:
             vact = np.ma.masked_equal(vact, 0)
 
-        act.values = vact.astype(np.int32)
+        act.values = vact
         act.isdiscrete = True
         act.codes = {0: "0", 1: "1"}
 
@@ -163,6 +163,49 @@ def test_xtgeo_file_memstream_check_ok():
     assert xtgeo._XTGeoFile(io.StringIO()).check_file()
 
 
+def test_xtgeo_file_prefetch_is_only_a_hint(tmp_path):
+    (tmp_path / "file.bin").write_bytes(b"\0" * 16)
+    xtgeo._XTGeoFile(tmp_path / "file.bin").prefetch()
+    xtgeo._XTGeoFile(tmp_path / "nosuchfile.bin").prefetch()
+    xtgeo._XTGeoFile(io.BytesIO(b"\0" * 16)).prefetch()
+
+
+def test_xtgeo_file_c_handle_without_fmemopen():
+    stream = io.BytesIO(bytes(range(256)) * 64)
+    gfile = xtgeo._XTGeoFile(stream)
+    gfile._fake_nofmem = True
+
+    assert "Swig" in str(gfile.get_cfhandle())
+    with open(gfile._tmpfile, "rb") as tmpfile:
+        assert tmpfile.read() == stream.getvalue()
+
+    assert gfile.cfclose() is True
+    assert not pathlib.Path(gfile._tmpfile).exists()
+    stream.write(b"stream is still writable")
+
+
+def test_xtgeo_file_c_handle_without_fmemopen_removes_tmpfile_on_error(
+    monkeypatch, tmp_path
+):
+    tmpfiles = []
+    orig_mkstemp = xsys.mkstemp
+
+    def mkstemp(**kwargs):
+        tmpfiles.append(orig_mkstemp(dir=tmp_path, **kwargs))
+        return tmpfiles[-1]
+
+    monkeypatch.setattr(xsys, "mkstemp", mkstemp)
+    stream = io.BytesIO(b"\0" * 16)
+    gfile = xtgeo._XTGeoFile(stream)
+    gfile._fake_nofmem = True
+    stream.close()
+
+    with pytest.raises(ValueError, match="closed file"):
+        gfile.get_cfhandle()
+    assert len(tmpfiles) == 1
+    assert not list(tmp_path.iterdir())
+
+
 @pytest.mark.parametrize("filename", files_formats.keys())
 def test_xtgeo_file_properties(testpath, filename):
     gfile = xtgeo._XTGeoFile(testpath / filename)
@@ -392,3 +392,13 @@ def test_import_restart_namestyle(dates, reek_run):
     assert "PRESSURE--1999_12_12" not in gps
     assert "SWAT--1999_12_01" in gps
     assert gps.names == [p.name for p in gps]
+
+
+@pytest.mark.parametrize("initprops", [None, [], ["PORO"]])
+def test_prefetch_ecl_run_is_harmless(tmp_path, initprops):
+    from xtgeo.grid3d._grid_import_ecl import prefetch_ecl_run
+
+    groot = str(tmp_path / "RUN")
+    prefetch_ecl_run(groot, initprops=initprops, restartprops=["SWAT"])
+    (tmp_path / "RUN.INIT").write_bytes(b"\0" * 16)
+    prefetch_ecl_run(groot, initprops=initprops)
@@ -27,6 +27,22 @@ def test_read_simple_property(file_data):
             assert list(kw) == [("PROP", ["1", "2", "3", "4"])]
 
 
+@pytest.mark.parametrize(
+    "file_data, values",
+    [
+        ("PROP\n 1 2 3 4 / \n", ["1", "2", "3", "4"]),
+        ("-- a comment \nPROP\n \n 1 2 \n -- a comment \n 3 4 /", ["1", "2", "3", "4"]),
+        ("PROP\n 1 2 -- not the end /\n 3 4 / 5 \n", ["1", "2", "3", "4"]),
+        ("PROP\n 1 2*2 0*7 -- 3*3\n 4/ /", ["1", "2", "2", "4/"]),
+        ("PROP\n 1 2--3\n 4 /\nPROP\n 5 /", ["1", "2--3", "4"]),
+    ],
+)
+def test_read_simple_keyword(file_data, values):
+    with patch("builtins.open", mock_open(read_data=file_data)) as mock_file:
+        with open_grdecl(mock_file, keywords=[], simple_keywords=["PROP"]) as kw:
+            assert next(kw) == ("PROP", values)
+
+
 @pytest.mark.parametrize(
     "repeats, value",
     [(6, 1.0), (0, 1), (3, "INP")],
@@ -85,10 +101,14 @@ def test_read_long_keyword():
         "NOECHO\nPROP\n 1 2 3 4 -- a comment",
     ],
 )
-def test_read_prop_raises_error_when_no_forwardslash(undelimited_file_data):
+@pytest.mark.parametrize("simple", [False, True])
+def test_read_prop_raises_error_when_no_forwardslash(undelimited_file_data, simple):
+    keywords = {"keywords": [], "simple_keywords": ["PROP"]}
+    if not simple:
+        keywords = {"keywords": ["PROP"]}
     with patch(
         "builtins.open", mock_open(read_data=undelimited_file_data)
     ) as mock_file:
-        with open_grdecl(mock_file, keywords=["PROP"]) as kw:
+        with open_grdecl(mock_file, **keywords) as kw:
             with pytest.raises(ValueError):
                 list(kw)
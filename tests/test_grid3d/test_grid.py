@@ -2,6 +2,7 @@
 import math
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
 
 import numpy as np
@@ -10,7 +11,7 @@ from hypothesis import given
 
 import xtgeo
 from xtgeo.common import XTGeoDialog
-from xtgeo.grid3d import Grid
+from xtgeo.grid3d import Grid, _grid_etc1
 
 from .grid_generator import dimensions, increments, xtgeo_grids
 
@@ -157,6 +158,34 @@ def test_emerald_grid_values(emerald_grid):
     assert emerald_grid.get_prop_by_name("Xerxes").name == "Xerxes"
 
 
+def test_get_prop_by_name():
+    grd = xtgeo.create_box_grid((2, 3, 4))
+    dx, dy = grd.get_dx(name="DX"), grd.get_dy(name="DY")
+    grd.props = [dx, dy]
+
+    assert grd.get_prop_by_name("DY") is dy
+    assert grd.get_prop_by_name("DZ") is None
+
+    dy.name = "DYY"
+    assert grd.get_prop_by_name("DYY") is dy
+    assert grd.get_prop_by_name("DY") is None
+
+
+def test_actnum_indices_dtype():
+    grd = xtgeo.create_box_grid((2, 3, 4))
+    grd._actnumsv[0, 1, 2] = 0
+
+    # the public methods keep the numpy default dtype
+    assert grd.actnum_indices.dtype == np.intp
+    assert grd.get_actnum_indices(order="F").dtype == np.intp
+    assert grd.get_actnum_indices(inverse=True).tolist() == [6]
+
+    compact = grd._get_actnum_indices(order="F", compact=True)
+    assert compact.dtype == np.int32
+    assert compact.tolist() == grd.get_actnum_indices(order="F").tolist()
+    assert len(compact) == grd.nactive
+
+
 def test_roffbin_get_dataframe_for_grid(emerald_grid):
     df = emerald_grid.get_dataframe()
 
@@ -227,6 +256,82 @@ def test_convert_vs_xyz_cell_corners():
     assert grd1.get_xyz_cell_corners((4, 2, 3)) == grd2.get_xyz_cell_corners((4, 2, 3))
 
 
+def test_xyz_cell_corners_batch():
+    grd = xtgeo.create_box_grid((4, 3, 2), rotation=30.0, flip=-1)
+    grd._actnumsv[1, 2, 0] = 0
+    ijk = [(i, j, k) for i in range(1, 5) for j in range(1, 4) for k in range(1, 3)]
+
+    corners = grd.get_xyz_cell_corners_batch(ijk)
+
+    assert corners.shape == (24, 24)
+    for cell, row in zip(ijk, corners):
+        expected = grd.get_xyz_cell_corners(cell)
+        if expected is None:
+            assert np.isnan(row).all()
+        else:
+            assert row.tolist() == pytest.approx(expected)
+
+    zerobased = grd.get_xyz_cell_corners_batch(
+        [(1, 2, 0)], activeonly=False, zerobased=True
+    )
+    assert zerobased[0].tolist() == pytest.approx(
+        grd.get_xyz_cell_corners((2, 3, 1), activeonly=False)
+    )
+
+    with pytest.raises(ValueError, match="outside the grid"):
+        grd.get_xyz_cell_corners_batch([(5, 1, 1)])
+    with pytest.raises(ValueError, match="outside the grid"):
+        grd.get_xyz_cell_corners((5, 1, 1))
+    with pytest.raises(ValueError, match="outside the grid"):
+        grd.get_xyz_cell_corners((0, 1, 1))
+    with pytest.raises(ValueError, match="must be integers"):
+        grd.get_xyz_cell_corners_batch([(1.9, 1, 1)])
+    with pytest.raises(ValueError, match="must be integers"):
+        grd.get_xyz_cell_corners((1.9, 1, 1))
+    with pytest.raises(ValueError, match="must be integers"):
+        grd.get_xyz_cell_corners_batch(np.ones((2, 3), dtype=np.float32))
+    assert grd.get_xyz_cell_corners(np.array((1, 1, 1))) == pytest.approx(
+        grd.get_xyz_cell_corners((1, 1, 1))
+    )
+
+
+def test_cell_volume_reused_buffer():
+    grd = xtgeo.create_box_grid((3, 2, 2), increment=(10.0, 20.0, 5.0))
+    grd._zcornsv[1:, :, :, :] *= 1.5
+    bulk = grd.get_bulk_volume(asmasked=False).values
+
+    for i in range(1, 4):
+        for j in range(1, 3):
+            for k in range(1, 3):
+                vol = grd.get_cell_volume((i, j, k), precision=4)
+                assert vol == pytest.approx(bulk[i - 1, j - 1, k - 1])
+
+    with ThreadPoolExecutor(2) as pool:
+        vols = list(pool.map(grd.get_cell_volume, [(1, 1, 1), (3, 2, 2)] * 10))
+    assert vols == [grd.get_cell_volume((1, 1, 1)), grd.get_cell_volume((3, 2, 2))] * 10
+
+
+def test_geometry_properties_as_float32():
+    grd = xtgeo.create_box_grid((3, 2, 2), rotation=30.0)
+    grd._actnumsv[0, 0, 0] = 0
+
+    getters = {
+        "get_xyz": grd.get_xyz,
+        "get_xyz_corners": grd.get_xyz_corners,
+        "get_dx": lambda **kw: (grd.get_dx(**kw),),
+        "get_dy": lambda **kw: (grd.get_dy(**kw),),
+        "get_dz": lambda **kw: (grd.get_dz(**kw),),
+    }
+    for name, getter in getters.items():
+        for double, single in zip(getter(), getter(dtype=np.float32)):
+            assert single.values.dtype == np.float32, name
+            assert (single.values.mask == double.values.mask).all(), name
+            assert single.values.filled(0) == pytest.approx(double.values.filled(0))
+
+    with pytest.raises(ValueError, match="dtype"):
+        grd.get_xyz(dtype=np.int32)
+
+
 def test_roff_bin_vs_ascii_export(tmp_path):
     grd1 = xtgeo.create_box_grid(dimension=(10, 10, 10))
 
@@ -617,6 +722,18 @@ def test_get_dxdy_is_get_dx_and_dy(grid):
     assert np.all(grid.get_dxdy(asmasked=True)[1].values == grid.get_dy().values)
 
 
+@given(xtgeo_grids)
+def test_fused_dxdydz_is_get_dx_dy_dz(grid):
+    dx, dy, dz = _grid_etc1._get_dxdydz_values(grid, ("euclid", "horizontal", "euclid"))
+    assert np.array_equal(
+        dx, grid.get_dx(asmasked=False, metric="euclid").values.ravel()
+    )
+    assert np.array_equal(dy, grid.get_dy(asmasked=False).values.ravel())
+    assert np.array_equal(
+        dz, grid.get_dz(asmasked=False, metric="euclid").values.ravel()
+    )
+
+
 def test_benchmark_grid_get_dz(benchmark):
     grd = xtgeo.create_box_grid(dimension=(100, 100, 100))
 
@@ -753,6 +870,20 @@ def test_grid_bad_dimensions_construction(
         )
 
 
+def test_grid_fortran_order_construction():
+    box = xtgeo.create_box_grid((4, 3, 2))
+    grd = Grid(
+        np.asfortranarray(box._coordsv),
+        np.asfortranarray(box._zcornsv),
+        np.asfortranarray(box._actnumsv),
+    )
+
+    assert grd._coordsv.flags.c_contiguous
+    assert grd._zcornsv.flags.c_contiguous
+    assert grd._actnumsv.flags.c_contiguous
+    assert np.array_equal(grd.get_xyz()[2].values, box.get_xyz()[2].values)
+
+
 def test_get_vtk_geometries_box(show_plot):
     grd = xtgeo.create_box_grid((2, 6, 4), increment=(20, 10, 7))
     grd._actnumsv[0, 0, 0] = 0
@@ -3,15 +3,20 @@
 
 
 import io
+import os
 import sys
 
 import hypothesis.strategies as st
+import numpy as np
 import pytest
+import resfo
+import roffio
 from hypothesis import assume, given
 
 import xtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.grid3d import GridProperties, GridProperty
+from xtgeo.grid3d._roff_parameter import RoffParameter
 
 from .grid_generator import xtgeo_grids
 from .gridprop_generator import grid_properties as gridproperties_elements
@@ -140,6 +145,43 @@ def test_scan_dates():
     assert dl[2][1] == 20000201
 
 
+def test_scan_dates_written_restart(tmp_path):
+    records = []
+    for seqnum, (day, month, year) in enumerate([(1, 1, 2000), (15, 6, 2001)]):
+        intehead = np.zeros(411, dtype=np.int32)
+        intehead[64:67] = (day, month, year)
+        records += [
+            ("SEQNUM  ", np.array([seqnum], dtype=np.int32)),
+            ("INTEHEAD", intehead),
+            ("PRESSURE", np.ones(4, dtype=np.float32)),
+        ]
+    resfo.write(tmp_path / "TEST.UNRST", records)
+
+    dl = GridProperties.scan_dates(tmp_path / "TEST.UNRST")
+    assert dl == [(0, 20000101), (1, 20010615)]
+
+    with pytest.raises(xtgeo.XTGeoCLibError, match="nmax"):
+        GridProperties.scan_dates(tmp_path / "TEST.UNRST", maxdates=1)
+
+
+def test_scan_keywords_rescans_rewritten_file(tmp_path):
+    fname = tmp_path / "TEST.UNRST"
+    for nitems in (4, 5):
+        resfo.write(
+            fname,
+            [
+                ("SEQNUM  ", np.array([0], dtype=np.int32)),
+                ("INTEHEAD", np.zeros(411, dtype=np.int32)),
+                ("PRESSURE", np.ones(nitems, dtype=np.float32)),
+            ],
+        )
+        # backdate the file so that the scan result is cached
+        os.utime(fname, (0, 0))
+        for _ in range(2):
+            kw = GridProperties.scan_keywords(fname)
+            assert kw[2] == ("PRESSURE", "REAL", nitems, kw[2][3])
+
+
 def test_scan_dates_invalid_file():
     """Raise an error before trying to scan a non-existent file."""
     with pytest.raises(ValueError, match="does not exist"):
@@ -307,3 +349,147 @@ def test_props_set_get() -> None:
     props = [GridProperty()]
     gp = GridProperties(props=props)
     assert gp.props == props
+
+
+@given(gridproperties())
+def test_generate_hash(gridproperties):
+    gps_copy = gridproperties.copy()
+    assert gridproperties.generate_hash() == gps_copy.generate_hash()
+
+
+def test_copy_shallow():
+    prop = GridProperty(ncol=2, nrow=2, nlay=2, values=1.0, name="poro")
+    gps = GridProperties(props=[prop])
+
+    shallow = gps.copy(deep=False)
+    assert shallow.props[0] is prop
+    assert shallow.names == ["poro"]
+    shallow.append_props([GridProperty(ncol=2, nrow=2, nlay=2, name="perm")])
+    assert gps.names == ["poro"]
+
+    deep = gps.copy()
+    assert deep.props[0] is not prop
+    assert np.array_equal(deep.props[0].values, prop.values)
+
+
+def test_generate_hash_changes_with_values():
+    prop = GridProperty(ncol=2, nrow=2, nlay=2, values=1.0)
+    gps = GridProperties(props=[prop])
+    hash1 = gps.generate_hash()
+    assert gps.generate_hash() == hash1
+
+    prop.values[0, 0, 0] = 99.0
+    hash2 = gps.generate_hash()
+    assert hash2 != hash1
+
+    gps.append_props([GridProperty(ncol=2, nrow=2, nlay=2, values=1.0)])
+    assert gps.generate_hash() not in (hash1, hash2)
+
+
+def test_generate_hash_hashmethod():
+    gps = GridProperties(props=[GridProperty(ncol=2, nrow=2, nlay=2, values=1.0)])
+    sha = gps.generate_hash()
+    blake = gps.generate_hash("blake2b")
+    assert len(blake) == 128
+    assert blake != sha
+    assert gps.generate_hash("sha256") == sha
+
+    with pytest.raises(ValueError, match="Invalid hash method"):
+        gps.generate_hash("foo")
+
+
+def test_get_prop_by_name_after_rename():
+    prop1 = GridProperty(ncol=2, nrow=2, nlay=2, name="PORO")
+    prop2 = GridProperty(ncol=2, nrow=2, nlay=2, name="PERMX")
+    gps = GridProperties(props=[prop1])
+    gps.append_props([prop2])
+    assert gps["PORO"] is prop1
+    assert gps["PERMX"] is prop2
+
+    prop1.name = "NEWPORO"
+    assert "PORO" not in gps
+    assert gps["NEWPORO"] is prop1
+
+
+def test_append_props_mismatching_dimensions():
+    gps = GridProperties(props=[GridProperty(ncol=2, nrow=2, nlay=2, name="PORO")])
+    with pytest.raises(ValueError, match="Mismatching dimensions"):
+        gps.append_props([GridProperty(ncol=3, nrow=2, nlay=2, name="PERMX")])
+    assert gps.names == ["PORO"]
+
+
+def test_gridproperties_from_roff_several_names():
+    grid = xtgeo.create_box_grid((3, 4, 5))
+    poro = GridProperty(grid, name="PORO", values=0.25)
+    facies = GridProperty(grid, name="FACIES", discrete=True, values=2, codes={2: "A"})
+    parameters = [RoffParameter.from_xtgeo_grid_property(p) for p in (poro, facies)]
+
+    buff = io.BytesIO()
+    roffio.write(
+        buff,
+        [
+            ("filedata", {"filetype": "parameter"}),
+            ("dimensions", {"nX": 3, "nY": 4, "nZ": 5}),
+        ]
+        + [
+            (
+                "parameter",
+                {
+                    "name": p.name,
+                    "codeNames": p.code_names or [],
+                    "codeValues": p.code_values
+                    if p.code_values is not None
+                    else np.array([], dtype=np.int32),
+                    "data": p.values,
+                },
+            )
+            for p in parameters
+        ],
+    )
+    buff.seek(0)
+
+    props = xtgeo.gridproperties_from_file(
+        buff, fformat="roff", names=["FACIES", "PORO"]
+    )
+
+    assert props.names == ["PORO", "FACIES"]
+    assert props["PORO"].values.mean() == pytest.approx(0.25)
+    assert props["FACIES"].isdiscrete
+    assert props["FACIES"].codes == {2: "A"}
+
+
+@given(gridproperties_elements())
+def test_gridproperties_from_xtgeofile(grid_property):
+    buff = io.BytesIO()
+    grid_property.to_file(buff, fformat="roff")
+    buff.seek(0)
+    props = xtgeo.gridproperties_from_file(
+        xtgeo._XTGeoFile(buff), fformat="roff", names=[grid_property.name]
+    )
+
+    assert props.names == [grid_property.name]
+
+
+def test_get_dataframe_dtypes():
+    grid = xtgeo.create_box_grid((2, 3, 4))
+    gps = GridProperties(props=[GridProperty(grid, name="PORO", values=0.3)])
+
+    df = gps.get_dataframe(activeonly=False, ijk=True, xyz=True, grid=grid)
+    assert df["ACTNUM"].dtype == np.int8
+    assert df["IX"].dtype == np.int32
+    assert df["X_UTME"].dtype == np.float64
+    assert df["PORO"].dtype == np.float32
+
+    df = gps.get_dataframe(activeonly=False, doubleformat=True, grid=grid)
+    assert df["PORO"].dtype == np.float64
+
+
+def test_names_setter_copies_list():
+    gps = GridProperties(props=[GridProperty(name="PORO"), GridProperty(name="PERMX")])
+    newnames = ["A", "B"]
+    gps.names = newnames
+    newnames.append("C")
+    assert gps.names == ["A", "B"]
+
+    with pytest.raises(ValueError, match="does not match"):
+        gps.names = ["A"]
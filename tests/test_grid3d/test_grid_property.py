@@ -166,6 +166,17 @@ def test_describe():
     assert "Name" in desc
 
 
+def test_generate_hash():
+    """Hash depends on the values, and handles a fully masked property."""
+    xx = GridProperty(ncol=3, nrow=2, nlay=1, values=np.array([1, 2, 3, 4, 5, 6]))
+    yy = GridProperty(ncol=3, nrow=2, nlay=1, values=np.array([1, 2, 3, 4, 5, 7]))
+    assert xx.generate_hash() == xx.copy().generate_hash()
+    assert xx.generate_hash() != yy.generate_hash()
+
+    xx.values = np.ma.masked_all((3, 2, 1))
+    assert xx.generate_hash() == xx.copy().generate_hash()
+
+
 def test_discrete_copy():
     """Copy a discrete grid_property with codes."""
     gprop = GridProperty(
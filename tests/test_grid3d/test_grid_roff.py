@@ -351,3 +351,26 @@ def test_deprecated_fileread(roff_grid):
             new_grid = RoffGrid.from_file(converted_buff)
 
     assert new_grid == roff_grid
+
+
+@given(roff_grids(dim=st.tuples(*([st.integers(min_value=4, max_value=5)] * 3))))
+def test_deprecated_fileread_from_stream_position(roff_grid):
+    buff = io.BytesIO()
+    roff_grid.to_file(buff)
+
+    new_buff = io.BytesIO(
+        b"prefix"
+        + re.sub(
+            b".*creationDate\0[^\0]*\0char\0filetype\0grid\0",
+            XTGEO_214_HEADER,
+            buff.getvalue(),
+        )
+    )
+    new_buff.seek(6)
+
+    with pytest.warns(UserWarning, match="nonstandard but harmless roff"):
+        with handle_deprecated_xtgeo_roff_file(new_buff) as converted_buff:
+            new_grid = RoffGrid.from_file(converted_buff)
+
+    assert new_grid == roff_grid
+    assert new_buff.tell() == 6
@@ -461,3 +461,17 @@ def test_hdf5_import(benchmark_grid, tmp_path):
     grd2 = xtgeo.grid_from_file(fna, fformat="hdf")
 
     assert grd2._subgrids == OrderedDict({"1": range(1, nlay + 1)})
+
+
+@pytest.mark.parametrize("fformat", ["hdf", "xtg"])
+def test_shifted_subformat_coordinates(tmp_path, fformat):
+    grid = create_box(tmp_path)
+    fname = tmp_path / f"grid.{fformat}"
+    if fformat == "hdf":
+        grid.to_hdf(fname, subformat=444)
+    else:
+        grid.to_xtgf(fname, subformat=444)
+
+    grd2 = xtgeo.grid_from_file(fname, fformat=fformat)
+
+    assert_allclose(grid._coordsv, grd2._coordsv, atol=0.01)
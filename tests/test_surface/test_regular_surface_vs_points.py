@@ -5,7 +5,6 @@ import pytest
 import xtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.surface import RegularSurface
-from xtgeo.xyz import Points
 
 xtg = XTGeoDialog()
 logger = xtg.basiclogger(__name__)
@@ -21,7 +20,7 @@ TPATH = xtg.testpathobj
 ftop1 = TPATH / "surfaces/reek/1/reek_stooip_map.gri"
 
 
-@pytest.fixture(name="reek_map")
+@pytest.fixture(name="reek_map", scope="module")
 def fixture_reek_map():
     logger.info("Loading surface")
     return xtgeo.surface_from_file(ftop1)
@@ -44,15 +43,9 @@ def test_list_xy_points_as_numpies(reek_map):
 def test_map_to_points(tmpdir, reek_map):
     """Get the list of the coordinates"""
 
-    px = Points()
+    assert isinstance(reek_map, RegularSurface)
 
-    surf = xtgeo.surface_from_file(ftop1)
-
-    assert isinstance(surf, RegularSurface)
-
-    assert surf.values.mean() == pytest.approx(0.5755830099, abs=0.001)
-
-    px = xtgeo.points_from_surface(surf)
+    assert reek_map.values.mean() == pytest.approx(0.5755830099, abs=0.001)
 
     # convert to a Points instance
     px = xtgeo.points_from_surface(reek_map)